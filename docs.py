@@ -2,67 +2,84 @@
 """
 Rogue Resident Documentation CLI
 Simple interface for the documentation system
+
+Exports run in-process by importing scripts/export.py; pass --subprocess to
+run them in a separate interpreter instead.
 """
 
-import sys
+import os
 import subprocess
-from pathlib import Path
+import sys
 
-def run_export(format_type="all", system_name=None, include_archives=False, copy_to=None, export_references=False):
-    """Run the export script with the specified format"""
-    try:
-        cmd = [
-            "python3", "scripts/export.py", 
-            "--format", format_type
-        ]
+def _export_args(format_type, system_name=None, focus_area=None, include_archives=False, copy_to=None, export_references=False,
+                 force=False, watch=False):
+    """Build the scripts/export.py argument list shared by both run modes"""
+    args = ["--format", format_type]
+    
+    if system_name:
+        args.extend(["--system", system_name])
+    
+    if focus_area:
+        args.extend(["--focus-area", focus_area])
         
-        if system_name:
-            cmd.extend(["--system", system_name])
-            
-        if include_archives:
-            cmd.append("--include-archives")
-            
-        if export_references:
-            cmd.append("--export-references")
-            
-        if copy_to:
-            cmd.extend(["--copy-to", copy_to])
+    if include_archives:
+        args.append("--include-archives")
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+    if export_references:
+        args.append("--export-references")
         
-        if result.returncode == 0:
-            print(result.stdout)
-        else:
-            print(f"Error: {result.stderr}")
+    if copy_to:
+        args.extend(["--copy-to", copy_to])
+    
+    if force:
+        args.append("--force")
+    
+    if watch:
+        args.append("--watch")
+    
+    return args
+
+def _run_in_process(args):
+    """Import the exporter and run it directly; progress prints as it happens"""
+    scripts_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts")
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+    import export
+    
+    try:
+        export.main(args)
+    except SystemExit as e:
+        # argparse errors exit; report them instead of leaving the CLI
+        if e.code not in (0, None):
+            print(f"Error: export exited with status {e.code}")
+
+def _run_in_subprocess(args):
+    """Opt-in isolation: run scripts/export.py in a fresh interpreter, streaming its output"""
+    result = subprocess.run(["python3", "scripts/export.py"] + args)
+    if result.returncode != 0:
+        print(f"Error: export exited with status {result.returncode}")
+
+def _run(args, isolate):
+    if isolate:
+        _run_in_subprocess(args)
+    else:
+        _run_in_process(args)
+
+def run_export(format_type="all", system_name=None, include_archives=False, copy_to=None, export_references=False, isolate=False,
+               force=False, watch=False):
+    """Run the export with the specified format"""
+    try:
+        _run(_export_args(format_type, system_name=system_name, include_archives=include_archives,
+                          copy_to=copy_to, export_references=export_references, force=force, watch=watch), isolate)
     except Exception as e:
         print(f"Error running export: {e}")
 
-def run_narrative_export(focus_area="all", include_archives=False, copy_to=None, export_references=False):
+def run_narrative_export(focus_area="all", include_archives=False, copy_to=None, export_references=False, isolate=False,
+                         force=False, watch=False):
     """Run the narrative workflow export with the specified focus area"""
     try:
-        cmd = [
-            "python3", "scripts/export.py", 
-            "--format", "narrative"
-        ]
-        
-        if focus_area:
-            cmd.extend(["--focus-area", focus_area])
-            
-        if include_archives:
-            cmd.append("--include-archives")
-            
-        if export_references:
-            cmd.append("--export-references")
-            
-        if copy_to:
-            cmd.extend(["--copy-to", copy_to])
-        
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            print(result.stdout)
-        else:
-            print(f"Error: {result.stderr}")
+        _run(_export_args("narrative", focus_area=focus_area, include_archives=include_archives,
+                          copy_to=copy_to, export_references=export_references, force=force, watch=watch), isolate)
     except Exception as e:
         print(f"Error running narrative export: {e}")
 
@@ -101,11 +118,15 @@ Narrative focus areas:
   world     - World building, medical physics setting, lore
   plot      - Story progression, tutorial narrative, journal system
   all       - Comprehensive narrative documentation (default)
+  every     - All four of the above in one pass (12 documents)
 
 Enhanced workflow options:
   --export-references   Export referenced files to references/ folder (recommended!)
   --include-archives    Include all design docs, character content, and game constants
   --copy-to [path]      Copy generated files to specified directory (e.g., game repo)
+  --force               Rebuild outputs even if their inputs are unchanged
+  --watch               Keep running and re-export when data/, content/ or templates/ change
+  --subprocess          Run the exporter in a separate python3 process (isolation fallback)
 
 Examples:
   python3 docs.py export                                                # Export all formats
@@ -116,6 +137,8 @@ Examples:
   python3 docs.py workflow activity-interface                           # Generate docs with embedded content
   python3 docs.py workflow activity-interface --include-archives        # Include ALL context (creates very large files)
   python3 docs.py workflow activity-interface --export-references --copy-to ../game-repo/docs/  # Export to another repo
+  python3 docs.py workflow all --export-references                      # Every interface in one run
+  python3 docs.py workflow boss-interface,tps-minigame                  # A list of interfaces
   
   python3 docs.py narrative character --export-references               # Character-focused narrative docs 🎭
   python3 docs.py narrative world                                       # World building & lore docs 🌍
@@ -124,55 +147,61 @@ Examples:
     """)
 
 def main():
-    if len(sys.argv) < 2:
+    # --subprocess/--force/--watch may appear anywhere; strip them before positional parsing
+    isolate = "--subprocess" in sys.argv
+    force = "--force" in sys.argv
+    watch = "--watch" in sys.argv
+    argv = [arg for arg in sys.argv if arg not in ("--subprocess", "--force", "--watch")]
+    
+    if len(argv) < 2:
         show_help()
         return
     
-    command = sys.argv[1]
+    command = argv[1]
     
     if command == "export":
-        format_type = sys.argv[2] if len(sys.argv) > 2 else "all"
-        run_export(format_type)
+        format_type = argv[2] if len(argv) > 2 else "all"
+        run_export(format_type, isolate=isolate, force=force, watch=watch)
     elif command == "workflow":
-        if len(sys.argv) < 3:
+        if len(argv) < 3:
             print("❌ Error: workflow command requires a system name")
             print("Example: python3 docs.py workflow activity-interface")
             print("Enhanced: python3 docs.py workflow activity-interface --include-archives")
             return
         
         # Parse workflow arguments
-        system_name = sys.argv[2]
-        include_archives = "--include-archives" in sys.argv
-        export_references = "--export-references" in sys.argv
+        system_name = argv[2]
+        include_archives = "--include-archives" in argv
+        export_references = "--export-references" in argv
         
         # Parse --copy-to flag
         copy_to = None
-        if "--copy-to" in sys.argv:
-            copy_index = sys.argv.index("--copy-to")
-            if copy_index + 1 < len(sys.argv):
-                copy_to = sys.argv[copy_index + 1]
+        if "--copy-to" in argv:
+            copy_index = argv.index("--copy-to")
+            if copy_index + 1 < len(argv):
+                copy_to = argv[copy_index + 1]
         
-        run_export("workflow", system_name, include_archives, copy_to, export_references)
+        run_export("workflow", system_name, include_archives, copy_to, export_references, isolate=isolate, force=force, watch=watch)
     elif command == "narrative":
         # Parse narrative arguments
-        focus_area = sys.argv[2] if len(sys.argv) > 2 else "all"
-        if focus_area not in ["character", "world", "plot", "all"]:
+        focus_area = argv[2] if len(argv) > 2 else "all"
+        if focus_area not in ["character", "world", "plot", "all", "every"]:
             print(f"❌ Error: Invalid focus area '{focus_area}'")
-            print("Valid focus areas: character, world, plot, all")
+            print("Valid focus areas: character, world, plot, all, every")
             print("Example: python3 docs.py narrative character --export-references")
             return
         
-        include_archives = "--include-archives" in sys.argv
-        export_references = "--export-references" in sys.argv
+        include_archives = "--include-archives" in argv
+        export_references = "--export-references" in argv
         
         # Parse --copy-to flag
         copy_to = None
-        if "--copy-to" in sys.argv:
-            copy_index = sys.argv.index("--copy-to")
-            if copy_index + 1 < len(sys.argv):
-                copy_to = sys.argv[copy_index + 1]
+        if "--copy-to" in argv:
+            copy_index = argv.index("--copy-to")
+            if copy_index + 1 < len(argv):
+                copy_to = argv[copy_index + 1]
         
-        run_narrative_export(focus_area, include_archives, copy_to, export_references)
+        run_narrative_export(focus_area, include_archives, copy_to, export_references, isolate=isolate, force=force, watch=watch)
     elif command == "help":
         show_help()
     else:
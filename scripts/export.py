@@ -4,130 +4,2785 @@ Rogue Resident Documentation Export System
 Generates targeted documentation exports from structured YAML data
 """
 
-import yaml
+import time
+_MODULE_IMPORT_START = time.perf_counter()
+
+import argparse
+import hashlib
 import json
 import os
-import argparse
-from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
-import glob
-from collections import defaultdict
+import pickle
+import sys
+import tempfile
+import traceback
 import re
+import posixpath
+import threading
+import importlib
+import multiprocessing
+import queue
+from pathlib import Path
+from collections import ChainMap
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from collections.abc import Mapping, MutableMapping
 from datetime import datetime
+from types import MappingProxyType
+
+# yaml and jinja2 are imported where they are first needed (see _heavy_import)
+# so `--help` and argument errors stay instant.
+IMPORT_BUDGET_MS = 50
+HEAVY_IMPORT_TIMINGS = {}
+
+
+def _heavy_import(module_name):
+    """Import a dependency on first use, recording how long the import took"""
+    module = sys.modules.get(module_name)
+    if module is not None and not getattr(getattr(module, '__spec__', None), '_initializing', False):
+        return module
+    # Not imported yet, or still being imported on another thread (background
+    # writers, scheduled targets): import_module waits for it to finish
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    HEAVY_IMPORT_TIMINGS.setdefault(module_name, time.perf_counter() - start)
+    return module
+
+
+YAML_BACKENDS = ('auto', 'c', 'python')
+
+
+def resolve_yaml_backend(preference='auto'):
+    """Return (name, SafeLoader), preferring libyaml's CSafeLoader when PyYAML has it"""
+    if preference not in YAML_BACKENDS:
+        raise ValueError(f"Unknown YAML backend '{preference}' (choose from {', '.join(YAML_BACKENDS)})")
+    
+    yaml = _heavy_import('yaml')
+    has_libyaml = hasattr(yaml, 'CSafeLoader')
+    if preference == 'python' or (preference == 'auto' and not has_libyaml):
+        return 'python', yaml.SafeLoader
+    if not has_libyaml:
+        raise ValueError("PyYAML was built without libyaml; use --yaml-backend python or auto")
+    return 'c', yaml.CSafeLoader
+
+
+def _atomic_write_bytes(file_path, data, mode=None):
+    """Write bytes through a temp file in the same directory, then rename into place"""
+    file_path = Path(file_path)
+    fd, tmp_name = tempfile.mkstemp(dir=str(file_path.parent), prefix=f".{file_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        if mode is not None:
+            # mkstemp creates 0600 files; exports should get normal permissions
+            os.chmod(tmp_name, mode)
+        os.replace(tmp_name, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _write_cache_file(file_path, data):
+    """Atomically write a cache entry, creating its directory; False if it could not be written
+
+    Caches only ever save work, so a read-only or full cache directory is
+    reported as a failed store and never breaks an export.
+    """
+    try:
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write_bytes(file_path, data)
+        return True
+    except OSError:
+        return False
+
+
+def _prune_lru(cache_dir, suffix, max_bytes):
+    """Delete the least recently used files ending in suffix under cache_dir
+    (oldest mtime first) until the rest fit in max_bytes; returns how many went"""
+    entries = []
+    for dirpath, _, filenames in os.walk(cache_dir):
+        for name in filenames:
+            if name.endswith(suffix):
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+    
+    total = sum(size for _, size, _ in entries)
+    evicted = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= size
+        evicted += 1
+    return evicted
+
+
+def _hit_rate(hits, misses):
+    """'N hits, M misses (P% hit rate)' for a cache summary line"""
+    total = hits + misses
+    hit_rate = (hits / total * 100) if total else 0
+    return f"{hits} hits, {misses} misses ({hit_rate:.0f}% hit rate)"
+
+
+class OutputWriter:
+    """✍️ The one place export files are written ✍️
+
+    Content identical to what is already on disk is not rewritten, so mtimes
+    (and the Next.js dev server / game repo watchers) stay quiet. Changed
+    content goes through a temp file and rename, so a killed run never leaves
+    a half-written output.
+
+    With workers > 0, writes are handed to background threads through bounded
+    queues (rendering blocks only once queue_size writes are waiting). A path
+    always goes to the same worker, so repeated writes land in order. flush()
+    is the barrier: it waits for every queued write, or only for those of one
+    owner (the export target that queued them), whose errors pop_errors()
+    then returns without touching anyone else's.
+    """
+
+    def __init__(self, workers=0, queue_size=64):
+        self.files_written = 0
+        self.files_skipped = 0
+        self.bytes_written = 0
+        self.bytes_skipped = 0
+        self._errors = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._written = threading.Condition(self._lock)
+        umask = os.umask(0)
+        os.umask(umask)
+        self._file_mode = 0o666 & ~umask
+        
+        self._queues = []
+        self._threads = []
+        if workers > 0:
+            for _ in range(workers):
+                write_queue = queue.Queue(maxsize=max(1, queue_size))
+                thread = threading.Thread(target=self._drain, args=(write_queue,), daemon=True)
+                thread.start()
+                self._queues.append(write_queue)
+                self._threads.append(thread)
+
+    def _unchanged(self, path, data, block_size=1 << 16):
+        try:
+            if os.stat(path).st_size != len(data):
+                return False
+            # Block by block, so a large output is not held twice
+            view = memoryview(data)
+            with open(path, 'rb') as f:
+                for offset in range(0, len(data), block_size):
+                    if f.read(block_size) != view[offset:offset + block_size]:
+                        return False
+            return True
+        except OSError:
+            return False
+
+    def write_bytes(self, path, data, owner=None):
+        """Write data to path unless it already holds exactly that; True if written
+        
+        With background workers the write is queued and None returned; failures
+        are collected under owner rather than raised.
+        """
+        if self._queues:
+            path = Path(path)
+            with self._lock:
+                self._pending[owner] = self._pending.get(owner, 0) + 1
+            self._queues[hash(path) % len(self._queues)].put((path, data, owner))
+            return None
+        return self._write_now(path, data)
+
+    def _write_now(self, path, data):
+        if self._unchanged(path, data):
+            with self._lock:
+                self.files_skipped += 1
+                self.bytes_skipped += len(data)
+            return False
+        _atomic_write_bytes(path, data, mode=self._file_mode)
+        with self._lock:
+            self.files_written += 1
+            self.bytes_written += len(data)
+        return True
+
+    def write_text(self, path, text, owner=None):
+        return self.write_bytes(path, text.encode('utf-8'), owner)
+
+    def write_chunks(self, path, chunks):
+        """Stream text chunks (e.g. from Template.generate) to path; True if written
+        
+        The chunks go straight into the temp file, so the whole document is
+        never held in memory; it is then compared with the existing file block
+        by block. Always synchronous, since the chunks are rendered as they
+        are consumed.
+        """
+        path = Path(path)
+        if self._queues:
+            # An earlier queued write of the same path has to land first
+            self._queues[hash(path) % len(self._queues)].join()
+        fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in chunks:
+                    f.write(chunk.encode('utf-8'))
+                size = f.tell()
+            if self._same_content(tmp_name, path):
+                os.unlink(tmp_name)
+                with self._lock:
+                    self.files_skipped += 1
+                    self.bytes_skipped += size
+                return False
+            os.chmod(tmp_name, self._file_mode)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+        with self._lock:
+            self.files_written += 1
+            self.bytes_written += size
+        return True
+
+    def _same_content(self, new_path, path, block_size=1 << 16):
+        try:
+            if os.stat(new_path).st_size != os.stat(path).st_size:
+                return False
+            with open(new_path, 'rb') as new, open(path, 'rb') as old:
+                while True:
+                    block = new.read(block_size)
+                    if block != old.read(block_size):
+                        return False
+                    if not block:
+                        return True
+        except OSError:
+            return False
+
+    def _drain(self, write_queue):
+        while True:
+            item = write_queue.get()
+            try:
+                if item is None:
+                    return
+                path, data, owner = item
+                try:
+                    self._write_now(path, data)
+                except Exception as e:
+                    with self._lock:
+                        self._errors.setdefault(owner, []).append((path, e))
+                finally:
+                    with self._written:
+                        self._pending[owner] -= 1
+                        if not self._pending[owner]:
+                            del self._pending[owner]
+                            self._written.notify_all()
+            finally:
+                write_queue.task_done()
+
+    def flush(self, owner=None):
+        """Wait until the queued writes of owner (every queued write if None) have finished"""
+        if owner is None:
+            for write_queue in self._queues:
+                write_queue.join()
+            return
+        with self._written:
+            self._written.wait_for(lambda: owner not in self._pending)
+
+    def pop_errors(self, owner=None):
+        """(path, exception) for each failed background write of owner (of anyone if None) since the last call"""
+        with self._lock:
+            if owner is None:
+                errors = [error for owner_errors in self._errors.values() for error in owner_errors]
+                self._errors = {}
+            else:
+                errors = self._errors.pop(owner, [])
+        return errors
+
+    def close(self):
+        """Flush, stop the background workers and return any outstanding write errors"""
+        self.flush()
+        for write_queue in self._queues:
+            write_queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._queues = []
+        self._threads = []
+        return self.pop_errors()
+
+    def copy_file(self, source, dest):
+        # The source may itself be an output still waiting in the queue
+        self.flush()
+        with open(source, 'rb') as f:
+            return self.write_bytes(dest, f.read())
+
+    def mirror_tree(self, source_dir, dest_dir):
+        """Make dest_dir a copy of source_dir, writing only changed files and removing stale ones"""
+        source_dir, dest_dir = Path(source_dir), Path(dest_dir)
+        self.flush()
+        expected = set()
+        for dirpath, _, filenames in os.walk(source_dir):
+            rel_dir = Path(dirpath).relative_to(source_dir)
+            (dest_dir / rel_dir).mkdir(parents=True, exist_ok=True)
+            for name in filenames:
+                expected.add(rel_dir / name)
+                self.copy_file(Path(dirpath) / name, dest_dir / rel_dir / name)
+        
+        for dirpath, dirnames, filenames in os.walk(dest_dir, topdown=False):
+            rel_dir = Path(dirpath).relative_to(dest_dir)
+            for name in filenames:
+                if rel_dir / name not in expected:
+                    os.unlink(Path(dirpath) / name)
+            if rel_dir != Path('.') and not os.listdir(dirpath):
+                os.rmdir(dirpath)
+
+    def summary(self):
+        return (f"✍️ Output writes: {self.files_written} files / {self.bytes_written:,} bytes written, "
+                f"{self.files_skipped} files / {self.bytes_skipped:,} bytes unchanged (skipped)")
+
+
+class ParsedYamlCache:
+    """📦 On-disk cache of parsed YAML documents 📦
+
+    Entries are keyed by the resolved file path and the YAML backend that
+    parsed them (the C and Python loaders are not guaranteed to build
+    identical data), and validated against the file's mtime and size. When
+    the stat changes but the content hash does not (touch, checkout), the
+    entry is still a hit and gets re-stamped.
+    """
+
+    def __init__(self, cache_dir, backend):
+        self.cache_dir = Path(cache_dir)
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, file_path):
+        key = hashlib.sha1(f"{self.backend}\0{Path(file_path).resolve()}".encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.pickle"
+
+    def _read_entry(self, entry_path):
+        try:
+            with open(entry_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            # Missing, truncated or stale-format entries are just misses
+            return None
+
+    def _write_entry(self, entry_path, entry):
+        _write_cache_file(entry_path, pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def load(self, file_path, parse):
+        """Return (data, source text) for file_path, calling parse(text) only on a miss"""
+        stat = os.stat(file_path)
+        entry_path = self._entry_path(file_path)
+        entry = self._read_entry(entry_path)
+        if entry and 'source' not in entry:
+            entry = None
+        
+        if entry and entry['path'] == str(file_path) and \
+                entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            self.hits += 1
+            return entry['data'], entry['source']
+        
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        
+        if entry and entry['path'] == str(file_path) and entry['sha256'] == digest:
+            self.hits += 1
+            entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+            self._write_entry(entry_path, entry)
+            return entry['data'], entry['source']
+        
+        self.misses += 1
+        text = raw.decode('utf-8')
+        data = parse(text)
+        self._write_entry(entry_path, {
+            'path': str(file_path),
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha256': digest,
+            'data': data,
+            'source': text
+        })
+        return data, text
+
+    def summary(self):
+        return f"📦 YAML parse cache: {_hit_rate(self.hits, self.misses)}"
+
+
+class TemplateBytecodeCache:
+    """🧩 On-disk cache of compiled Jinja templates, with compile timing 🧩
+
+    Wraps jinja2.FileSystemBytecodeCache. Jinja stores each template's source
+    checksum with its bytecode, so editing a .jinja file is a miss that
+    recompiles and re-stores just that template. Jinja compiles between
+    get_bucket() and set_bucket() on a miss, which is the time measured here.
+    """
+
+    def __init__(self, cache_dir, salt=''):
+        self.cache_dir = Path(cache_dir)
+        self.salt = salt
+        self.hits = 0
+        self.misses = 0
+        self.compile_seconds = 0.0
+        self.load_seconds = 0.0
+        self._cache = None
+        self._compile_started = {}
+        self._lock = threading.Lock()
+
+    def get_bucket(self, environment, name, filename, source):
+        start = time.perf_counter()
+        if self._cache is None:
+            jinja2 = _heavy_import('jinja2')
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._cache = jinja2.FileSystemBytecodeCache(str(self.cache_dir))
+        # The salt joins the source checksum, so bytecode compiled by an older
+        # version of the exporter's extensions is recompiled
+        bucket = self._cache.get_bucket(environment, name, filename, source + self.salt)
+        now = time.perf_counter()
+        with self._lock:
+            if bucket.code is None:
+                self.misses += 1
+                self._compile_started[bucket.key] = now
+            else:
+                self.hits += 1
+                self.load_seconds += now - start
+        return bucket
+
+    def set_bucket(self, bucket):
+        with self._lock:
+            started = self._compile_started.pop(bucket.key, None)
+            if started is not None:
+                self.compile_seconds += time.perf_counter() - started
+        try:
+            self._cache.set_bucket(bucket)
+        except OSError:
+            # Same as _write_cache_file: a failed store is just a miss next run
+            pass
+
+    def summary(self):
+        return (f"🧩 Template bytecode cache: {self.hits} hits, {self.misses} misses - "
+                f"compiled in {self.compile_seconds * 1000:.1f} ms, "
+                f"loaded from cache in {self.load_seconds * 1000:.1f} ms")
+
+
+FRAGMENT_CACHE_MAX_MB = 64
+
+
+def _update_fragment_digest(h, value):
+    """Feed a fragment input into hash h piece by piece, never building one big serialization
+
+    Each type has its own tag byte and every length is explicit, so 5 and
+    "5", a tuple and a list, or a set and a sorted list never hash alike.
+    """
+    if isinstance(value, str):
+        data = value.encode('utf-8')
+        h.update(b's%d:' % len(data))
+        h.update(data)
+    elif value is None:
+        h.update(b'n')
+    elif isinstance(value, bool):
+        h.update(b't' if value else b'f')
+    elif isinstance(value, int):
+        h.update(b'i%d;' % value)
+    elif isinstance(value, float):
+        h.update(b'd%s;' % repr(value).encode('ascii'))
+    elif isinstance(value, Mapping):
+        h.update(b'{%d:' % len(value))
+        for key, item in value.items():
+            _update_fragment_digest(h, key)
+            _update_fragment_digest(h, item)
+    elif isinstance(value, (list, tuple)):
+        h.update(b'[%d:' % len(value) if isinstance(value, list) else b'(%d:' % len(value))
+        for item in value:
+            _update_fragment_digest(h, item)
+    elif isinstance(value, (set, frozenset)):
+        # Unordered: members go in sorted by their own digests
+        members = []
+        for item in value:
+            member = hashlib.sha256()
+            _update_fragment_digest(member, item)
+            members.append(member.digest())
+        h.update(b'<%d:' % len(value))
+        for member in sorted(members):
+            h.update(member)
+    else:
+        # jinja Undefined, dates and other objects: type name, then their text
+        name = type(value).__qualname__.encode('utf-8')
+        h.update(b'o%d:' % len(name))
+        h.update(name)
+        _update_fragment_digest(h, str(value))
+
+
+class FragmentCache:
+    """🧱 Rendered {% cache %} template fragments, stored on disk 🧱
+
+    A fragment is keyed by its parsed body and a digest of its input values,
+    so a block repeated across the audience documents renders once per
+    content version and later runs reuse it. Fragments are not held in
+    memory (they can be most of a document); between release() calls (one
+    set of audience documents) inputs are hashed once per object, since the
+    audiences share one context. Least recently used entries are pruned
+    past max_bytes when the exporter closes.
+    """
+
+    VERSION = 3
+
+    def __init__(self, cache_dir, max_bytes):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._digests = {}
+        self._lock = threading.Lock()
+
+    def _digest(self, value):
+        memo = self._digests.get(id(value))
+        if memo is not None and memo[0] is value:
+            return memo[1]
+        h = hashlib.sha256()
+        _update_fragment_digest(h, value)
+        digest = h.hexdigest()
+        with self._lock:
+            self._digests[id(value)] = (value, digest)
+        return digest
+
+    def release(self):
+        """Drop the input digests (and the contexts they pin)"""
+        with self._lock:
+            self._digests = {}
+
+    def render(self, body_digest, inputs, render):
+        """The cached text of a fragment, calling render() only on a miss"""
+        key = hashlib.sha256(f"{self.VERSION}\0{body_digest}\0".encode('ascii') +
+                             "\0".join(self._digest(value) for value in inputs).encode('ascii')).hexdigest()
+        entry_path = self.cache_dir / key[:2] / f"{key}.txt"
+        
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                text = f.read()
+            os.utime(entry_path)
+        except OSError:
+            text = None
+        if text is not None:
+            with self._lock:
+                self.hits += 1
+            return text
+        
+        text = render()
+        with self._lock:
+            self.misses += 1
+        _write_cache_file(entry_path, text.encode('utf-8'))
+        return text
+
+    def prune(self):
+        """Delete least recently used entries until the store fits in max_bytes"""
+        self.evictions += _prune_lru(self.cache_dir, '.txt', self.max_bytes)
+        self.release()
+
+    def summary(self):
+        return f"🧱 Fragment cache: {_hit_rate(self.hits, self.misses)}, {self.evictions} evicted"
+
+
+_FRAGMENT_CACHE_EXTENSION = None
+
+
+def fragment_cache_extension():
+    """The Jinja extension behind {% cache %}, defined on first use so jinja2 stays a lazy import
+    
+    {% cache a, b %}...{% endcache %} renders its body through the environment's
+    fragment_cache (a FragmentCache). The body may only read variables named
+    in the inputs, which parse() checks. With fragment_cache None the body
+    renders inline, so Template.generate() still streams it chunk by chunk.
+    """
+    global _FRAGMENT_CACHE_EXTENSION
+    if _FRAGMENT_CACHE_EXTENSION is not None:
+        return _FRAGMENT_CACHE_EXTENSION
+    
+    ext = _heavy_import('jinja2.ext')
+    meta = _heavy_import('jinja2.meta')
+    nodes = _heavy_import('jinja2.nodes')
+    
+    class FragmentCacheExtension(ext.Extension):
+        tags = {'cache'}
+        
+        def __init__(self, environment):
+            super().__init__(environment)
+            environment.extend(fragment_cache=None)
+        
+        def parse(self, parser):
+            lineno = next(parser.stream).lineno
+            inputs = [parser.parse_expression()]
+            while parser.stream.skip_if('comma'):
+                inputs.append(parser.parse_expression())
+            body = parser.parse_statements(('name:endcache',), drop_needle=True)
+            
+            # The key covers only the inputs, so a body reading anything else could go stale
+            listed = {node.name for expression in inputs for node in (expression, *expression.find_all(nodes.Name))
+                      if isinstance(node, nodes.Name)}
+            read = meta.find_undeclared_variables(nodes.Template(body).set_environment(self.environment))
+            unlisted = read - listed - set(self.environment.globals)
+            if unlisted:
+                parser.fail(f"{{% cache %}} body reads {', '.join(sorted(unlisted))}, "
+                            f"which must be listed as inputs", lineno)
+            
+            # Node reprs carry no line numbers: identical blocks in different templates match
+            body_digest = hashlib.sha256(repr(body).encode('utf-8')).hexdigest()
+            call = self.call_method('_render_fragment', [nodes.Const(body_digest), nodes.List(inputs)])
+            cached = nodes.CallBlock(call, [], [], body).set_lineno(lineno)
+            return nodes.If(self.call_method('_caching'), [cached], [], body).set_lineno(lineno)
+        
+        def _caching(self):
+            return self.environment.fragment_cache is not None
+        
+        def _render_fragment(self, body_digest, inputs, caller):
+            cache = self.environment.fragment_cache
+            if cache is None:
+                return caller()
+            return cache.render(body_digest, inputs, caller)
+    
+    # Compiled templates look the extension up by identifier, which defaults to
+    # the defining module: '__main__' when run as a script, 'export' when
+    # docs.py imports it. Pin it so cached bytecode works for both
+    FragmentCacheExtension.identifier = 'rogue_docs_export.FragmentCacheExtension'
+    _FRAGMENT_CACHE_EXTENSION = FragmentCacheExtension
+    return FragmentCacheExtension
+
+
+def _jinja_environment(template_dir, bytecode_cache, fragment_cache):
+    """Jinja2 environment over template_dir with the {% cache %} extension"""
+    jinja2 = _heavy_import('jinja2')
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(str(template_dir)),
+        bytecode_cache=bytecode_cache,
+        extensions=[fragment_cache_extension()]
+    )
+    env.fragment_cache = fragment_cache
+    return env
+
+
+def _plain_data(value, memo=None):
+    """Copy of a template value with every mapping turned into a dict, so it
+    pickles; objects shared within the value stay shared in the copy"""
+    if memo is None:
+        memo = {}
+    if not isinstance(value, (Mapping, list, tuple)):
+        return value
+    copied = memo.get(id(value))
+    if copied is not None:
+        return copied[1]
+    if isinstance(value, Mapping):
+        copy = {key: _plain_data(item, memo) for key, item in value.items()}
+    elif isinstance(value, list):
+        copy = [_plain_data(item, memo) for item in value]
+    else:
+        copy = tuple(_plain_data(item, memo) for item in value)
+    memo[id(value)] = (value, copy)
+    return copy
+
+
+_RENDER_WORKER = None
+
+
+def _init_render_worker(template_dir, bytecode_dir, bytecode_salt, fragment_dir, fragment_max_bytes, context):
+    """Process-pool initializer: each render worker gets its environment and the shared context once"""
+    global _RENDER_WORKER
+    bytecode_cache = TemplateBytecodeCache(bytecode_dir, bytecode_salt) if bytecode_dir else None
+    fragment_cache = FragmentCache(fragment_dir, fragment_max_bytes) if fragment_dir else None
+    _RENDER_WORKER = (_jinja_environment(template_dir, bytecode_cache, fragment_cache), context)
+
+
+def _render_template_worker(template_name):
+    """Process-pool entry point: render one template against the worker's context
+
+    Returns (text, fragment_hits, fragment_misses) so the parent can fold the
+    fragment cache stats into its own.
+    """
+    env, context = _RENDER_WORKER
+    cache = env.fragment_cache
+    hits, misses = (cache.hits, cache.misses) if cache is not None else (0, 0)
+    text = env.get_template(template_name).render(**context)
+    if cache is None:
+        return text, 0, 0
+    return text, cache.hits - hits, cache.misses - misses
+
+
+def _process_context():
+    """Start method for worker pools: a forked child would inherit the locks
+    of the parent's other threads in whatever state they were in"""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def _parse_yaml_worker(job):
+    """Process-pool entry point: parse one YAML file in a worker process
+
+    Returns (data, source, message, cache_hits, cache_misses, parses, parse_seconds)
+    so the parent can print warnings and fold the stats into its own.
+    """
+    yaml = _heavy_import('yaml')
+    file_path, backend, cache_dir = job
+    _, loader = resolve_yaml_backend(backend)
+    cache = ParsedYamlCache(cache_dir, backend) if cache_dir else None
+    timing = {'parses': 0, 'seconds': 0.0}
+    
+    def parse(text):
+        start = time.perf_counter()
+        try:
+            return yaml.load(text, Loader=loader)
+        finally:
+            timing['parses'] += 1
+            timing['seconds'] += time.perf_counter() - start
+    
+    data, source, message = {}, None, None
+    try:
+        if cache is not None:
+            data, source = cache.load(file_path, parse)
+        else:
+            with open(file_path, 'r') as f:
+                source = f.read()
+            data = parse(source)
+    except FileNotFoundError:
+        message = f"Warning: {file_path} not found"
+    except yaml.YAMLError as e:
+        message = f"Error parsing YAML {file_path}: {e}"
+    
+    hits = cache.hits if cache is not None else 0
+    misses = cache.misses if cache is not None else 0
+    return data, source, message, hits, misses, timing['parses'], timing['seconds']
+
+
+class LazyFileMapping(Mapping):
+    """🦥 Read-only mapping whose keys are known up front but whose values are
+    loaded from their files only on first access 🦥"""
+
+    def __init__(self, paths, loader):
+        self._paths = dict(paths)
+        self._loader = loader
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        path = self._paths[key]
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = self._loader(path)
+            return self._values[key]
+
+    def __iter__(self):
+        return iter(self._paths)
+
+    def __len__(self):
+        return len(self._paths)
+
+    def __contains__(self, key):
+        return key in self._paths
+
+    def __repr__(self):
+        return f"<LazyFileMapping {len(self._values)}/{len(self._paths)} loaded>"
+
+
+# Stands in for "no entry" where None is a legitimate stored value
+_MISSING = object()
+
+
+class LazyTemplateContext(MutableMapping):
+    """🦥 Template context whose expensive values are computed on first access 🦥
+
+    defer(name, compute) stores a thunk that runs once, the first time the
+    value is read. for_template() hands a template only the variables it
+    reads, so values none of the rendered templates use are never computed.
+    """
+
+    def __init__(self, values=()):
+        self._values = dict(values)
+        self._thunks = {}
+        self._lock = threading.RLock()
+
+    def defer(self, name, compute):
+        self._values.pop(name, None)
+        self._thunks[name] = compute
+
+    def for_template(self, variables):
+        """Plain dict of the given variables (None = every variable) for Template.render"""
+        if variables is None:
+            return dict(self)
+        # Context order, so deferred values compute in the order they were added
+        return {name: self[name] for name in self if name in variables}
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._values and key in self._thunks:
+                self._values[key] = self._thunks[key]()
+            return self._values[key]
+
+    def __setitem__(self, key, value):
+        self._thunks.pop(key, None)
+        self._values[key] = value
+
+    def __delitem__(self, key):
+        found = self._thunks.pop(key, _MISSING) is not _MISSING
+        if self._values.pop(key, _MISSING) is _MISSING and not found:
+            raise KeyError(key)
+
+    def __iter__(self):
+        return iter(dict.fromkeys([*self._values, *self._thunks]))
+
+    def __len__(self):
+        return len(dict.fromkeys([*self._values, *self._thunks]))
+
+    def __contains__(self, key):
+        return key in self._values or key in self._thunks
+
+    def __repr__(self):
+        pending = len(set(self._thunks) - set(self._values))
+        return f"<LazyTemplateContext {len(self)} variables, {pending} not computed>"
+
+
+class ContentStore:
+    """🪶 One canonical string per distinct document body 🪶
+
+    Markdown read into the corpus and files read again for embedding
+    (referenced content, related systems) are interned here. A body shared
+    by archived_content, embedded_content_files and embedded_related_systems
+    is then one object instead of a copy per read.
+    """
+
+    def __init__(self):
+        self._bodies = {}
+        self._lock = threading.Lock()
+        self.shared_reads = 0
+        self.shared_chars = 0
+
+    def intern(self, text):
+        """The canonical instance of text (text itself the first time it is seen)"""
+        if text is None:
+            return None
+        with self._lock:
+            canonical = self._bodies.setdefault(text, text)
+            if canonical is not text:
+                self.shared_reads += 1
+                self.shared_chars += len(text)
+        return canonical
+
+    def retain(self, texts):
+        """Forget every body not in texts (after the corpus changes under --watch)"""
+        with self._lock:
+            self._bodies = {text: text for text in texts if text is not None}
+
+    def summary(self):
+        return (f"🪶 Content store: {len(self._bodies)} distinct bodies, {self.shared_reads} repeat reads "
+                f"shared instead of copied ({self.shared_chars:,} chars)")
+
+
+class ExportCorpus:
+    """📚 Immutable, load-once snapshot of everything an export run reads 📚
+
+    Category and content mappings are read-only views (eager dicts or
+    LazyFileMappings); the merged system view and its classifications are
+    derived on first use so lazy corpora stay lazy until a map needs them.
+    """
+
+    CATEGORIES = ('cards', 'bosses', 'mentors', 'constants', 'interfaces')
+
+    def source_text(self, category, name):
+        """The YAML file's text as written (comments included), or None if unknown"""
+        return self.sources.get(category, {}).get(name)
+
+    __slots__ = CATEGORIES + ('content', 'sources', 'systems', '_derived')
+
+    def __init__(self, cards, bosses, mentors, constants, interfaces, content, sources=None):
+        values = {
+            'cards': MappingProxyType(cards),
+            'bosses': MappingProxyType(bosses),
+            'mentors': MappingProxyType(mentors),
+            'constants': MappingProxyType(constants),
+            'interfaces': MappingProxyType(interfaces),
+            'content': MappingProxyType(content),
+            # Original YAML text per category, so embedding never has to re-serialize
+            'sources': MappingProxyType({category: MappingProxyType(mapping)
+                                         for category, mapping in (sources or {}).items()}),
+            # Same precedence and key order as {**constants, **bosses, **mentors, **cards}
+            'systems': MappingProxyType(ChainMap(cards, mentors, bosses, constants)),
+            '_derived': {}
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"ExportCorpus is immutable (tried to set '{name}')")
+
+    @property
+    def system_priorities(self):
+        if 'priorities' not in self._derived:
+            self._derived['priorities'] = MappingProxyType(self._classify_priorities(self.systems))
+        return self._derived['priorities']
+
+    @property
+    def hierarchy_categories(self):
+        if 'hierarchy' not in self._derived:
+            self._derived['hierarchy'] = MappingProxyType(self._classify_hierarchy(self.systems))
+        return self._derived['hierarchy']
+
+    @staticmethod
+    def _classify_priorities(systems):
+        """Constellation-map node classes (boss, mentor, core, narrative, system)"""
+        priorities = {}
+        for system_name, system_data in systems.items():
+            if 'boss_encounter' in system_data or system_data.get('system_info', {}).get('type') == 'boss_encounter':
+                priorities[system_name] = 'boss'
+            elif 'mentor' in system_name or 'mentors' in system_data:
+                priorities[system_name] = 'mentor'
+            elif 'constellation' in system_name.lower():
+                priorities[system_name] = 'core'
+            elif any(keyword in system_name.lower() for keyword in ['pico', 'amara', 'journal']):
+                priorities[system_name] = 'narrative'
+            else:
+                priorities[system_name] = 'system'
+        return priorities
+
+    @staticmethod
+    def _classify_hierarchy(systems):
+        """Hierarchy-map categories, each a tuple of system names in load order"""
+        categories = {
+            'core': [],
+            'bosses': [],
+            'mentors': [], 
+            'narrative': [],
+            'systems': []
+        }
+        
+        for system_name, system_data in systems.items():
+            system_info = system_data.get('system_info', {})
+            
+            if 'constellation' in system_name.lower() or 'phenomenon' in system_name.lower():
+                categories['core'].append(system_name)
+            elif 'boss_encounter' in system_data or system_info.get('type') == 'boss_encounter':
+                categories['bosses'].append(system_name)
+            elif 'mentor' in system_name or 'mentors' in system_data:
+                categories['mentors'].append(system_name)
+            elif any(keyword in system_name.lower() for keyword in ['pico', 'amara', 'journal']):
+                categories['narrative'].append(system_name)
+            else:
+                categories['systems'].append(system_name)
+        
+        return {category: tuple(names) for category, names in categories.items()}
+
+    def replace(self, categories=None, content=None, sources=None):
+        """A new corpus with some category, content or source mappings swapped in"""
+        values = {category: getattr(self, category) for category in self.CATEGORIES}
+        values.update(categories or {})
+        all_sources = dict(self.sources)
+        all_sources.update(sources or {})
+        return ExportCorpus(content=self.content if content is None else content,
+                            sources=all_sources, **values)
+
+
+class TrackedMapping(Mapping):
+    """Read-only view of a corpus mapping that reports what was read from it
+
+    on_key(key) runs for every key looked up; on_listing() runs whenever the
+    key set itself is observed (iteration, len, a lookup that misses).
+    """
+
+    __slots__ = ('_mapping', '_on_key', '_on_listing')
+
+    def __init__(self, mapping, on_key, on_listing):
+        self._mapping = mapping
+        self._on_key = on_key
+        self._on_listing = on_listing
+
+    def __getitem__(self, key):
+        self._on_key(key)
+        try:
+            return self._mapping[key]
+        except KeyError:
+            self._on_listing()
+            raise
+
+    def __iter__(self):
+        self._on_listing()
+        return iter(self._mapping)
+
+    def __len__(self):
+        self._on_listing()
+        return len(self._mapping)
+
+    def __contains__(self, key):
+        self._on_key(key)
+        if key in self._mapping:
+            return True
+        self._on_listing()
+        return False
+
+    def __repr__(self):
+        return f"<TrackedMapping {self._mapping!r}>"
+
+
+class TrackedCorpus:
+    """📒 An ExportCorpus as seen by export targets: reads become build inputs 📒
+
+    Looking up a key records that key's source file; iterating a mapping (or
+    missing a key) records its directory listing. A target then depends on
+    exactly the YAML and markdown files it read, not on the whole corpus.
+    """
+
+    # Lookup order of ExportCorpus.systems
+    SYSTEM_CATEGORIES = ('cards', 'mentors', 'bosses', 'constants')
+
+    def __init__(self, corpus, paths, dirs, track_input, track_listing):
+        """paths maps each category (and 'content') to {key: source file}, dirs to its directory"""
+        self.corpus = corpus
+        self._paths = paths
+        self._dirs = dirs
+        self._track_input = track_input
+        self._track_listing = track_listing
+        self._listed = {}
+        self._views = {name: TrackedMapping(getattr(corpus, name),
+                                            lambda key, name=name: self._read(name, key),
+                                            lambda name=name: self._list(name))
+                       for name in ExportCorpus.CATEGORIES + ('content',)}
+        self._views['systems'] = TrackedMapping(corpus.systems, self._read_system,
+                                                lambda: self._list(*self.SYSTEM_CATEGORIES))
+
+    cards = property(lambda self: self._views['cards'])
+    bosses = property(lambda self: self._views['bosses'])
+    mentors = property(lambda self: self._views['mentors'])
+    constants = property(lambda self: self._views['constants'])
+    interfaces = property(lambda self: self._views['interfaces'])
+    content = property(lambda self: self._views['content'])
+    systems = property(lambda self: self._views['systems'])
+
+    @property
+    def system_priorities(self):
+        self.read_all(*self.SYSTEM_CATEGORIES)
+        return self.corpus.system_priorities
+
+    @property
+    def hierarchy_categories(self):
+        self.read_all(*self.SYSTEM_CATEGORIES)
+        return self.corpus.hierarchy_categories
+
+    def source_text(self, category, name):
+        self._read(category, name)
+        return self.corpus.source_text(category, name)
+
+    def _read(self, category, key):
+        path = self._paths[category].get(key)
+        if path is not None:
+            self._track_input(path)
+
+    def _read_system(self, key):
+        for category in self.SYSTEM_CATEGORIES:
+            if key in getattr(self.corpus, category):
+                self._read(category, key)
+                return
+            # Not in this category: a new file here would shadow the later ones
+            self._list(category)
+
+    def _listed_paths(self, category):
+        """(directories, files) whose state decides a category's key set"""
+        listed = self._listed.get(category)
+        if listed is None:
+            directory = self._dirs[category]
+            if category == 'content':
+                # Markdown is found recursively, so every directory under content/ counts
+                directories = [Path(dirpath) for dirpath, _, _ in os.walk(directory)] or [directory]
+            else:
+                directories = [directory]
+            mapping = getattr(self.corpus, category)
+            # Listed files the corpus left out (empty or unreadable) join it once they change
+            left_out = [path for key, path in self._paths[category].items() if key not in mapping]
+            listed = self._listed[category] = (directories, left_out)
+        return listed
+
+    def _list(self, *categories):
+        for category in categories:
+            directories, left_out = self._listed_paths(category)
+            for directory in directories:
+                self._track_listing(directory)
+            for path in left_out:
+                self._track_input(path)
+
+    def read_all(self, *categories):
+        """Record every file and the listing of each category (derived, whole-corpus views)"""
+        self._list(*categories)
+        for category in categories:
+            for key in getattr(self.corpus, category):
+                self._read(category, key)
+
+
+def _enum(value):
+    """Intern enum-like strings (domains, priorities, statuses) so they share one object"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _count_entries(value):
+    """Normalize a count that malformed YAML may give as an int, a list, or "N - ..." text"""
+    if isinstance(value, int):
+        return value
+    elif isinstance(value, list):
+        return len(value)
+    elif isinstance(value, str):
+        match = re.match(r'^(\d+)', value.strip())
+        return int(match.group(1)) if match else 0
+    else:
+        return 0
+
+
+PRIORITY_HIGH = _enum('high')
+
+
+class Card:
+    """🃏 One application card, normalized from a cards file 🃏"""
+
+    __slots__ = ('card_id', 'name', 'domain', 'associated_star', 'passive_effect',
+                 'active_effect', 'priority')
+
+    def __init__(self, card_id, card_data):
+        self.card_id = card_id
+        self.name = card_data.get('name', card_id)
+        self.domain = _enum(card_data.get('domain'))
+        self.associated_star = card_data.get('associated_star', 'N/A')
+        self.passive_effect = card_data.get('passive_effect', 'TBD')
+        self.active_effect = card_data.get('active_effect', 'TBD')
+        self.priority = _enum(card_data.get('implementation_priority', 'medium'))
+
+
+class CardSystem:
+    """A cards file: its domain sections plus normalized implementation status"""
+
+    DOMAIN_SECTIONS = ('treatment_planning_cards', 'radiation_therapy_cards',
+                       'linear_accelerator_cards', 'dosimetry_cards', 'cross_domain_cards')
+
+    __slots__ = ('system_id', 'sections', 'ranked_sections', 'complete_cards',
+                 'missing_passive', 'missing_active', 'has_implementation_status')
+
+    def __init__(self, system_id, system_data):
+        self.system_id = system_id
+        self.sections = {}
+        self.ranked_sections = {}
+        for section in self.DOMAIN_SECTIONS:
+            section_data = system_data.get(section)
+            if not section_data:
+                continue
+            cards = tuple(Card(card_id, card_data) for card_id, card_data in section_data.items()
+                          if isinstance(card_data, dict))
+            self.sections[section] = cards
+            # High priority first, otherwise in file order
+            self.ranked_sections[section] = (tuple(c for c in cards if c.priority is PRIORITY_HIGH) +
+                                             tuple(c for c in cards if c.priority is not PRIORITY_HIGH))
+        
+        impl_status = system_data.get('implementation_status', {})
+        self.has_implementation_status = bool(impl_status)
+        self.complete_cards = impl_status.get('complete_cards', 0) if impl_status else 0
+        self.missing_passive = _count_entries(impl_status.get('missing_passive_effects', [])) if impl_status else 0
+        self.missing_active = _count_entries(impl_status.get('missing_active_effects', [])) if impl_status else 0
+
+
+class Boss:
+    """⚡ Boss encounter summary fields from a bosses file ⚡"""
+
+    __slots__ = ('boss_id', 'name', 'encounter_type', 'difficulty', 'season', 'duration',
+                 'mastery_threshold', 'primary_domain', 'related_systems')
+
+    def __init__(self, boss_id, boss_data):
+        system_info = boss_data.get('system_info', {})
+        self.boss_id = boss_id
+        self.name = system_info.get('name', boss_id)
+        self.encounter_type = _enum(system_info.get('type', 'N/A'))
+        self.difficulty = _enum(system_info.get('difficulty', 'N/A'))
+        self.season = _enum(system_info.get('season_availability', 'N/A'))
+        self.duration = system_info.get('estimated_duration', 'N/A')
+        self.mastery_threshold = system_info.get('mastery_threshold', 'N/A')
+        self.primary_domain = _enum(system_info.get('primary_domain'))
+        self.related_systems = tuple(boss_data.get('cross_references', {}).get('related_systems', []))
+
+
+class Mentor:
+    """🎓 One mentor; trait/focus fields are None when the source block is absent 🎓"""
+
+    __slots__ = ('mentor_id', 'full_name', 'title', 'role', 'domain', 'archetype',
+                 'teaching_style', 'communication_style', 'primary_domain', 'primary_stars',
+                 'dialogue_themes', 'special_significance')
+
+    def __init__(self, mentor_id, mentor_data):
+        self.mentor_id = mentor_id
+        self.full_name = mentor_data.get('full_name', mentor_id)
+        self.title = mentor_data.get('title', 'N/A')
+        self.role = mentor_data.get('role', 'N/A')
+        self.domain = _enum(mentor_data.get('domain_expertise', 'N/A'))
+        self.archetype = _enum(mentor_data.get('personality_archetype', 'N/A'))
+        
+        traits = mentor_data.get('character_traits', {})
+        self.teaching_style = _enum(traits.get('teaching_style', 'N/A')) if traits else None
+        self.communication_style = _enum(traits.get('communication_style', 'N/A')) if traits else None
+        
+        domain_focus = mentor_data.get('domain_focus', {})
+        self.primary_domain = _enum(domain_focus.get('primary_domain', 'N/A')) if domain_focus else None
+        self.primary_stars = tuple(domain_focus.get('primary_stars', [])) if domain_focus else ()
+        
+        self.dialogue_themes = tuple(mentor_data.get('dialogue_themes', []))
+        self.special_significance = tuple(mentor_data.get('special_significance', {}).items())
+
+
+class GameModels:
+    """Typed views over the parsed corpus, built once per run
+
+    card_systems and mentor_files keep the per-file grouping the exports
+    print; bosses are keyed by id.
+    """
+
+    __slots__ = ('card_systems', 'bosses', 'mentor_files')
+
+    def __init__(self, cards_data, bosses_data, mentors_data):
+        self.card_systems = {name: CardSystem(name, data) for name, data in cards_data.items()}
+        self.bosses = {name: Boss(name, data) for name, data in bosses_data.items()}
+        self.mentor_files = {
+            name: tuple(Mentor(mentor_id, mentor) for mentor_id, mentor in data.get('mentors', {}).items())
+            for name, data in mentors_data.items()
+        }
+
+
+class PathIndex:
+    """🗂️ In-memory listing of data/ and content/, built once per run, for
+    resolving cross-references without probing the filesystem 🗂️"""
+
+    ROOTS = ('data', 'content')
+
+    def __init__(self, base_path, on_missing=None):
+        self.base_path = Path(base_path)
+        # Called with each probed path that doesn't exist (its directory
+        # listing decided the answer)
+        self.on_missing = on_missing
+        self.files = set()
+        for root in self.ROOTS:
+            for dirpath, _, filenames in os.walk(self.base_path / root):
+                rel_dir = Path(dirpath).relative_to(self.base_path).as_posix()
+                self.files.update(f"{rel_dir}/{name}" for name in filenames)
+
+    def exists(self, rel_path):
+        normalized = posixpath.normpath(rel_path)
+        if normalized.split('/', 1)[0] in self.ROOTS:
+            found = normalized in self.files
+        else:
+            # Outside the indexed roots: fall back to one real stat
+            found = (self.base_path / rel_path).is_file()
+        if not found and self.on_missing is not None:
+            self.on_missing(self.base_path / normalized)
+        return found
+
+    def resolve(self, content_path):
+        """Path for a reference, also trying it under content/; None if unresolved"""
+        for candidate in (content_path, "content/" + content_path.replace("content/", "")):
+            if self.exists(candidate):
+                return self.base_path / candidate
+        return None
+
+    def resolve_system(self, system_name):
+        """(file_path, Path or None) for a related system: data/, data/interfaces/, then content/*.md"""
+        candidates = [
+            f"data/{system_name}.yaml",
+            f"data/interfaces/{system_name}.yaml",
+            f"content/{system_name}.md"
+        ]
+        for file_path in candidates:
+            path = self.resolve(file_path)
+            if path is not None:
+                return file_path, path
+        return candidates[-1], None
+
+
+class TargetBuild:
+    """Inputs read and outputs written while one export target runs"""
+
+    __slots__ = ('inputs', 'outputs', 'listings', 'base_path_offsets', 'corpus')
+
+    def __init__(self):
+        self.inputs = set()
+        self.outputs = []
+        # Directories whose file listing the target looked at (by iterating a
+        # corpus mapping): adding or removing a file in one of them can change
+        # its output
+        self.listings = set()
+        # Output path -> character offsets where the checkout path was filled in
+        self.base_path_offsets = {}
+        # TrackedCorpus recording this target's reads (see the corpus property)
+        self.corpus = None
+
+
+class BuildManifest:
+    """📒 Which input files (with hashes) each export target was built from 📒
+
+    A target is up to date when its options match, its outputs still have the
+    stat recorded after the last build, every directory listing it looked at
+    is unchanged and every input matches its recorded stat or, after a
+    touch/checkout, its recorded content hash. Inputs that were looked for
+    and not found are recorded as None and must still be missing.
+    """
+
+    VERSION = 2
+
+    def __init__(self, manifest_file, base_path):
+        self.manifest_file = Path(manifest_file)
+        self.base_path = Path(base_path).resolve()
+        self.targets = self._read()
+        self.built = []
+        self.restored = []
+        self.up_to_date = []
+        self._dirty = False
+        self._lock = threading.RLock()
+
+    def _read(self):
+        try:
+            with open(self.manifest_file, 'r') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(manifest, dict) or manifest.get('version') != self.VERSION:
+            return {}
+        return manifest.get('targets', {})
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = json.dumps({'version': self.VERSION, 'targets': self.targets}, indent=2, sort_keys=True)
+            try:
+                self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+                _atomic_write_bytes(self.manifest_file, payload.encode('utf-8'))
+                self._dirty = False
+            except OSError:
+                # Without a manifest the next run simply rebuilds everything
+                pass
+
+    def _key(self, path):
+        return Path(os.path.relpath(os.path.abspath(path), self.base_path)).as_posix()
+
+    def _path(self, key):
+        return self.base_path / key
+
+    def _sha256(self, path):
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    def listing_digest(self, directory):
+        """Digest of the entry names in one directory, or None if it doesn't exist"""
+        try:
+            names = sorted(os.listdir(directory))
+        except OSError:
+            return None
+        return hashlib.sha256("\n".join(names).encode('utf-8')).hexdigest()
+
+    def _input_changed(self, key, record):
+        path = self._path(key)
+        if record is None:
+            return os.path.exists(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return True
+        if stat.st_mtime_ns == record['mtime_ns'] and stat.st_size == record['size']:
+            return False
+        if stat.st_size != record['size'] or self._sha256(path) != record['sha256']:
+            return True
+        # Same content under a new stat: re-stamp so the next check skips hashing
+        record['mtime_ns'] = stat.st_mtime_ns
+        self._dirty = True
+        return False
+
+    def is_fresh(self, target, options):
+        with self._lock:
+            return self._is_fresh(target, options)
+
+    def _is_fresh(self, target, options):
+        entry = self.targets.get(target)
+        if entry is None or entry['options'] != options:
+            return False
+        
+        for key, record in entry['outputs'].items():
+            try:
+                stat = os.stat(self._path(key))
+            except OSError:
+                return False
+            if stat.st_mtime_ns != record['mtime_ns'] or stat.st_size != record['size']:
+                return False
+        
+        for key, digest in entry['listings'].items():
+            if self.listing_digest(self._path(key)) != digest:
+                return False
+        
+        return not any(self._input_changed(key, record) for key, record in entry['inputs'].items())
+
+    def record(self, target, options, build):
+        """Store the inputs and outputs of a target that just finished building"""
+        inputs = {}
+        for path in sorted(build.inputs, key=str):
+            try:
+                stat = os.stat(path)
+                digest = self._sha256(path)
+            except OSError:
+                inputs[self._key(path)] = None
+                continue
+            inputs[self._key(path)] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': digest}
+        
+        outputs = {}
+        for path in build.outputs:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            outputs[self._key(path)] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+        
+        listings = {self._key(path): self.listing_digest(path) for path in sorted(build.listings, key=str)}
+        with self._lock:
+            self.targets[target] = {
+                'options': options,
+                'inputs': inputs,
+                'outputs': outputs,
+                'listings': listings
+            }
+            self._dirty = True
+
+    def affected_by(self, changed_paths):
+        """Recorded targets with one of changed_paths as an input or in a directory whose listing they read"""
+        keys = {self._key(path) for path in changed_paths}
+        directories = {posixpath.dirname(key) for key in keys}
+        with self._lock:
+            return {target for target, entry in self.targets.items()
+                    if keys & entry['inputs'].keys() or directories & entry['listings'].keys()}
+
+    def summary(self):
+        line = f"📒 Build manifest: {len(self.built)} built, {len(self.up_to_date)} up to date"
+        if self.restored:
+            line = line.replace(" built,", f" built, {len(self.restored)} restored from artifact cache,")
+        if self.up_to_date:
+            line += f" ({', '.join(self.up_to_date)})"
+        return line
+
+
+# Systems whose data/content is embedded into narrative contexts
+NARRATIVE_EMBED_SYSTEMS = (
+    'constellation-phenomenon', 'journal-system', 'visual-design',
+    'activity-framework', 'amara-narrative', 'pico-character',
+    'etching-system', 'journal-integration', 'visual-time-system',
+    'complete-card-system', 'educational-framework', 'game-constants'
+)
+
+# Key systems that each get a focused map from the visual export
+FOCUSED_MAP_SYSTEMS = ('pico-character', 'constellation-phenomenon', 'amara-narrative', 'journal-system')
+
+# Every interface is rendered in each of these modes by --format matrix
+MATRIX_MODES = ('embedded', 'references', 'archives')
+NARRATIVE_FOCUS_AREAS = ('character', 'world', 'plot', 'all')
+
+
+class MatrixJob:
+    """One cell of the export matrix: a workflow system or narrative focus area in one mode"""
+
+    __slots__ = ('kind', 'subject', 'mode')
+
+    def __init__(self, kind, subject, mode):
+        self.kind = kind
+        self.subject = subject
+        self.mode = mode
+
+    @property
+    def name(self):
+        return f"matrix:{self.mode}:{self.kind}:{self.subject}"
+
+    @property
+    def options(self):
+        return {
+            'include_archives': self.mode == 'archives',
+            'copy_to': None,
+            'export_references': self.mode == 'references'
+        }
+
+
+def parse_shard(spec):
+    """'i/N' -> (i, N) with 1 <= i <= N"""
+    try:
+        index, count = (int(part) for part in spec.split('/'))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{spec}' (expected i/N, e.g. 2/4)")
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{spec}': i must be between 1 and N")
+    return index, count
+
+
+def assign_shards(jobs, shard_count, timings):
+    """Split jobs into shard_count balanced lists (longest job first onto the least loaded shard)
+
+    Returns (shards, estimated seconds per shard). Jobs without a recorded
+    time are estimated at the mean of the known ones. The result only depends
+    on the job list and timings, so every node computes the same split.
+    """
+    known = [timings[job.name] for job in jobs if job.name in timings]
+    default = sum(known) / len(known) if known else 1.0
+    estimates = {job.name: timings.get(job.name, default) for job in jobs}
+    
+    shards = [[] for _ in range(shard_count)]
+    loads = [0.0] * shard_count
+    for job in sorted(jobs, key=lambda job: (-estimates[job.name], job.name)):
+        lightest = min(range(shard_count), key=lambda i: (loads[i], i))
+        shards[lightest].append(job)
+        loads[lightest] += estimates[job.name]
+    return shards, loads
+
+
+def _read_json_file(file_path, default):
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+class ExportTask:
+    """A schedulable unit of export work and the resources it reads and writes"""
+
+    __slots__ = ('name', 'run', 'inputs', 'outputs', 'deps', 'seconds', 'error')
+
+    def __init__(self, name, run, inputs=(), outputs=()):
+        self.name = name
+        self.run = run
+        self.inputs = frozenset(inputs)
+        self.outputs = frozenset(outputs)
+        self.deps = []
+        self.seconds = None
+        self.error = None
+
+
+class TaskScheduler:
+    """🗓️ Runs export tasks on a bounded thread pool, concurrently wherever
+    their declared inputs and outputs allow 🗓️
+
+    A task waits for every earlier-added task that writes a resource it reads
+    or writes, or reads a resource it writes; everything else may overlap.
+    Tasks therefore run in add() order when max_workers is 1.
+    """
+
+    def __init__(self, max_workers):
+        self.max_workers = max(1, max_workers)
+        self.tasks = []
+        self.wall_seconds = 0.0
+
+    def add(self, name, run, inputs=(), outputs=()):
+        task = ExportTask(name, run, inputs, outputs)
+        for earlier in self.tasks:
+            if earlier.outputs & (task.inputs | task.outputs) or task.outputs & earlier.inputs:
+                task.deps.append(earlier)
+        self.tasks.append(task)
+        return task
+
+    def _run_task(self, task):
+        start = time.perf_counter()
+        try:
+            task.run()
+        except Exception as e:
+            task.error = e
+        task.seconds = time.perf_counter() - start
+
+    def run(self):
+        """Run every task; returns the ones that failed (or were skipped after a failed dependency)"""
+        start = time.perf_counter()
+        pending = list(self.tasks)
+        running = {}
+        done = set()
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                for task in list(pending):
+                    if not all(dep in done for dep in task.deps):
+                        continue
+                    pending.remove(task)
+                    failed = [dep.name for dep in task.deps if dep.error is not None]
+                    if failed:
+                        task.error = RuntimeError(f"skipped because {', '.join(failed)} failed")
+                        task.seconds = 0.0
+                        done.add(task)
+                    else:
+                        running[executor.submit(self._run_task, task)] = task
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    done.add(running.pop(future))
+        
+        self.wall_seconds = time.perf_counter() - start
+        return [task for task in self.tasks if task.error is not None]
+
+    def critical_path(self):
+        """(tasks, seconds) of the longest dependency chain by measured time"""
+        finish = {}
+        previous = {}
+        # add() order is a topological order: dependencies are always earlier tasks
+        for task in self.tasks:
+            slowest_dep = max(task.deps, key=lambda dep: finish[dep], default=None)
+            finish[task] = (finish[slowest_dep] if slowest_dep else 0.0) + (task.seconds or 0.0)
+            previous[task] = slowest_dep
+        
+        if not self.tasks:
+            return [], 0.0
+        last = max(self.tasks, key=lambda task: finish[task])
+        path = []
+        task = last
+        while task is not None:
+            path.append(task)
+            task = previous[task]
+        return list(reversed(path)), finish[last]
+
+    def report(self):
+        total = sum(task.seconds or 0.0 for task in self.tasks)
+        lines = [f"🗓️ Scheduler: {len(self.tasks)} tasks on {self.max_workers} workers in "
+                 f"{self.wall_seconds:.2f}s (task time {total:.2f}s)"]
+        for task in self.tasks:
+            after = f" (after {', '.join(dep.name for dep in task.deps)})" if task.deps else ""
+            if task.error is not None:
+                lines.append(f"  ❌ {task.name}: {task.error}{after}")
+            else:
+                lines.append(f"  ⏱️ {task.name}: {task.seconds:.2f}s{after}")
+        path, seconds = self.critical_path()
+        lines.append(f"  🔗 Critical path: {' → '.join(task.name for task in path)} ({seconds:.2f}s)")
+        return "\n".join(lines)
+
+
+# Directories --watch polls for changes
+WATCH_ROOTS = PathIndex.ROOTS + ('templates',)
+
+# Default size bound for --artifact-cache
+ARTIFACT_CACHE_MAX_MB = 512
+
+# Rendered in place of repository_info.base_path and filled in with the
+# checkout's absolute path as outputs are written. Cached artifacts keep the
+# marker at exactly those offsets, so an artifact rendered in one checkout can
+# be restored into another
+ARTIFACT_BASE_PATH_MARKER = "\0rogue-docs-base-path\0"
+
+
+class ArtifactCache:
+    """🗄️ Content-addressed store of rendered target outputs, shareable between
+    machines (a local directory or a shared mount) 🗄️
+
+    An artifact's key hashes the target name and options, the content of
+    every data/, content/ and templates/ file and the exporter's own source,
+    so any checkout with identical inputs can reuse another's render. The
+    checkout path is not part of the key: outputs are stored with the rendered
+    base path put back to ARTIFACT_BASE_PATH_MARKER. Entries are JSON files; the least recently
+    used ones are pruned past max_bytes when the exporter closes.
+    """
+
+    def __init__(self, cache_dir, max_bytes):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._digests = {}
+        self._lock = threading.Lock()
+
+    def _file_digest(self, path):
+        """sha256 of a file, memoized on its stat so unchanged files are hashed once per run"""
+        stat = os.stat(path)
+        memo_key = (str(path), stat.st_mtime_ns, stat.st_size)
+        digest = self._digests.get(memo_key)
+        if digest is None:
+            with open(path, 'rb') as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            self._digests[memo_key] = digest
+        return digest
+
+    def key(self, target, options, base_path):
+        base_path = Path(base_path)
+        
+        h = hashlib.sha256()
+        h.update(json.dumps({'target': target, 'options': options}, sort_keys=True).encode('utf-8'))
+        h.update(self._file_digest(__file__).encode('ascii'))
+        for root in WATCH_ROOTS:
+            for dirpath, dirnames, filenames in os.walk(base_path / root):
+                dirnames.sort()
+                for name in sorted(filenames):
+                    path = Path(dirpath) / name
+                    h.update(f"{path.relative_to(base_path).as_posix()}\0{self._file_digest(path)}\n".encode('utf-8'))
+        return h.hexdigest()
+
+    def _entry_path(self, key):
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def fetch(self, key):
+        """The stored artifact for key, or None; a hit refreshes the entry's LRU position"""
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                artifact = json.load(f)
+            os.utime(entry_path)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return artifact
+
+    def store(self, key, artifact):
+        if not _write_cache_file(self._entry_path(key), json.dumps(artifact).encode('utf-8')):
+            return
+        with self._lock:
+            self.stores += 1
+
+    def prune(self):
+        """Delete least recently used entries until the store fits in max_bytes"""
+        self.evictions += _prune_lru(self.cache_dir, '.json', self.max_bytes)
+
+    def summary(self):
+        return (f"🗄️ Artifact cache: {_hit_rate(self.hits, self.misses)}, "
+                f"{self.stores} stored, {self.evictions} evicted")
+
 
 class DocumentationExporter:
-    def __init__(self, base_path="."):
+    def __init__(self, base_path=".", use_cache=True, cache_dir=None, yaml_backend='auto', jobs=1, lazy=False,
+                 force=False, artifact_cache=None, artifact_cache_max_mb=ARTIFACT_CACHE_MAX_MB, render_workers=1,
+                 write_workers=0, write_queue_size=64, stream_renders=False):
         self.base_path = Path(base_path)
         self.data_path = self.base_path / "data"
         self.template_path = self.base_path / "templates"
         self.export_path = self.base_path / "exports"
         self.rogue_docs_web_path = self.base_path / "rogue-docs-web"
+        self.cache_path = Path(cache_dir) if cache_dir else self.base_path / ".export-cache"
         
         # Ensure export directory exists
         self.export_path.mkdir(exist_ok=True)
         
-        # Setup Jinja2 environment
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(str(self.template_path))
-        )
+        self.yaml_backend, self._yaml_loader = resolve_yaml_backend(yaml_backend)
+        self.yaml_parse_count = 0
+        self.yaml_parse_seconds = 0.0
+        
+        # Parsed YAML survives between runs; only changed files are re-parsed
+        self.yaml_cache = ParsedYamlCache(self.cache_path / "yaml", self.yaml_backend) if use_cache else None
+        self._yaml_sources = {}  # YAML path -> text it was last parsed from
+        
+        # jobs > 1 parses YAML across a process pool (0 = one worker per core)
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self._process_pool = None
+        
+        # lazy=True lists files up front but parses/reads each one on first access
+        self.lazy = lazy
+        
+        # Every export method reads the same snapshot; see the corpus property.
+        # Lazy loads are locked so concurrent targets build each one once
+        self._load_lock = threading.RLock()
+        self._corpus = None
+        self._models = None
+        self._path_index = None
+        self.unresolved_references = {}
+        self.load_counts = {'yaml': 0, 'markdown': 0, 'corpus_builds': 0}
+        # Every markdown/reference read is interned, so repeated bodies are shared
+        self.content_store = ContentStore()
+        
+        # Jinja2 environment, created on first template use (see jinja_env);
+        # compiled templates are cached on disk alongside the parsed YAML
+        self._jinja_env = None
+        self.template_cache = TemplateBytecodeCache(
+            self.cache_path / "jinja", salt=f"\n{{# fragment-cache-v{FragmentCache.VERSION} #}}") if use_cache else None
+        # {% cache %} blocks render once per content version and are reused across runs.
+        # Streamed renders skip them: a cached fragment is one whole string
+        self.fragment_cache = FragmentCache(
+            self.cache_path / "fragments", FRAGMENT_CACHE_MAX_MB * 1024 * 1024) if use_cache and not stream_renders else None
+        self._template_variables = {}
+        # render_workers > 1 renders a workflow's audience documents in worker
+        # processes; stream_renders writes them to disk chunk by chunk as they
+        # render (in this process)
+        self.render_workers = max(1, render_workers)
+        self.stream_renders = stream_renders
+        
+        # Targets run through run_target() are skipped when the manifest shows
+        # their inputs unchanged; force=True rebuilds (and re-records) them all
+        self.manifest = BuildManifest(self.cache_path / "build-manifest.json", self.base_path)
+        
+        # Every export file is written through here (write-if-changed, atomic),
+        # on background threads when write_workers > 0
+        self.writer = OutputWriter(write_workers, write_queue_size)
+        
+        # Optional shared store of rendered targets (see run_target)
+        self.artifacts = ArtifactCache(artifact_cache, artifact_cache_max_mb * 1024 * 1024) if artifact_cache else None
+        self.force = force
+        # Target tracking is per thread so concurrently scheduled targets
+        # (see export_all) each record their own inputs and outputs
+        self._local = threading.local()
+        self._build = None
+        self.last_build = None
+        
+        # Narrative pieces shared by all focus areas (see _narrative_memo)
+        self._narrative_memo_corpus = None
+        self._narrative_memo_values = {}
+    
+    @property
+    def _build(self):
+        """TargetBuild of the target running on this thread, or None"""
+        return getattr(self._local, 'build', None)
+    
+    @_build.setter
+    def _build(self, value):
+        self._local.build = value
+    
+    @property
+    def last_build(self):
+        """TargetBuild of the last target this thread rendered"""
+        return getattr(self._local, 'last_build', None)
+    
+    @last_build.setter
+    def last_build(self, value):
+        self._local.last_build = value
+    
+    @property
+    def jinja_env(self):
+        """Jinja2 environment over templates/; jinja2 is only imported when a template renders"""
+        if self._jinja_env is None:
+            with self._load_lock:
+                if self._jinja_env is None:
+                    self._jinja_env = _jinja_environment(self.template_path, self.template_cache,
+                                                         self.fragment_cache)
+        return self._jinja_env
+    
+    def load_yaml_data(self, file_path):
+        """Load YAML data from file, remembering the source text it was parsed from"""
+        yaml = _heavy_import('yaml')
+        self.load_counts['yaml'] += 1
+        try:
+            if self.yaml_cache is not None:
+                data, source = self.yaml_cache.load(file_path, self._parse_yaml)
+            else:
+                with open(file_path, 'r') as f:
+                    source = f.read()
+                data = self._parse_yaml(source)
+            self._yaml_sources[file_path] = source
+            return data
+        except FileNotFoundError:
+            print(f"Warning: {file_path} not found")
+            return {}
+        except yaml.YAMLError as e:
+            print(f"Error parsing YAML {file_path}: {e}")
+            return {}
+    
+    def _parse_yaml(self, text):
+        """Parse one YAML document with the selected backend, timing the parse"""
+        yaml = _heavy_import('yaml')
+        start = time.perf_counter()
+        try:
+            return yaml.load(text, Loader=self._yaml_loader)
+        finally:
+            self.yaml_parse_count += 1
+            self.yaml_parse_seconds += time.perf_counter() - start
+    
+    def _dump_yaml(self, data):
+        """Serialize data as block-style YAML
+        
+        Always the pure-Python emitter, whatever the loader backend: libyaml's
+        emitter folds long scalars differently, and dumps are rare and small.
+        """
+        yaml = _heavy_import('yaml')
+        return yaml.dump(data, Dumper=yaml.SafeDumper, default_flow_style=False, sort_keys=False)
+    
+    def yaml_backend_summary(self):
+        return (f"🔧 YAML backend: {self.yaml_backend} - {self.yaml_parse_count} parses "
+                f"in {self.yaml_parse_seconds * 1000:.1f} ms")
+    
+    def _yaml_files(self, category):
+        """YAML files of one data category, in directory listing order"""
+        category_dir = self.data_path / category
+        return list(category_dir.glob("*.yaml")) if category_dir.exists() else []
+    
+    def _markdown_files(self):
+        content_dir = self.base_path / "content"
+        return list(content_dir.rglob("*.md")) if content_dir.exists() else []
+    
+    def _get_pool(self):
+        """Worker processes for YAML parsing, created on first parallel load"""
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=self.jobs, mp_context=_process_context())
+        return self._process_pool
+    
+    def close(self):
+        """Shut down any worker pools started by this exporter, finishing queued writes;
+        returns the writes that failed"""
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+        errors = self.writer.close()
+        for path, error in errors:
+            print(f"❌ Failed to write {path}: {error}")
+        if self.fragment_cache is not None and self.fragment_cache.hits + self.fragment_cache.misses:
+            self.fragment_cache.prune()
+        # One walk of the store per run, not one per stored artifact
+        if self.artifacts is not None and self.artifacts.stores:
+            self.artifacts.prune()
+        return errors
+    
+    def _load_yaml_files(self, paths):
+        """Load many YAML files, returning their data in the order of paths"""
+        if self.jobs <= 1 or len(paths) < 2:
+            return [self.load_yaml_data(path) for path in paths]
+        
+        cache_dir = str(self.yaml_cache.cache_dir) if self.yaml_cache is not None else None
+        jobs = [(str(path), self.yaml_backend, cache_dir) for path in paths]
+        chunksize = max(1, len(jobs) // (self.jobs * 4))
+        
+        # map() yields in submission order, so the merge is deterministic
+        results = []
+        for path, (data, source, message, hits, misses, parses, parse_seconds) in \
+                zip(paths, self._get_pool().map(_parse_yaml_worker, jobs, chunksize=chunksize)):
+            self.load_counts['yaml'] += 1
+            if source is not None:
+                self._yaml_sources[path] = source
+            self.yaml_parse_count += parses
+            self.yaml_parse_seconds += parse_seconds
+            if self.yaml_cache is not None:
+                self.yaml_cache.hits += hits
+                self.yaml_cache.misses += misses
+            if message:
+                print(message)
+            results.append(data)
+        return results
+    
+    def _load_yaml_category(self, category):
+        paths = self._yaml_files(category)
+        if self.lazy:
+            # Unlike eager loads, empty or unparseable files stay listed (as {})
+            return LazyFileMapping({yaml_file.stem: yaml_file for yaml_file in paths},
+                                   lambda yaml_file: self.load_yaml_data(yaml_file) or {})
+        
+        category_data = {}
+        for yaml_file, data in zip(paths, self._load_yaml_files(paths)):
+            if data:
+                category_data[yaml_file.stem] = data
+        return category_data
+    
+    def load_all_cards(self):
+        """Load all card data from the cards directory"""
+        return self._load_yaml_category("cards")
+    
+    def load_all_bosses(self):
+        """Load all boss data from the bosses directory"""
+        return self._load_yaml_category("bosses")
+    
+    def load_all_mentors(self):
+        """Load all mentor data from the mentors directory"""
+        return self._load_yaml_category("mentors")
+    
+    def load_all_constants(self):
+        """Load all constant data from the constants directory"""
+        return self._load_yaml_category("constants")
+    
+    def load_all_interfaces(self):
+        """Load all interface data from the interfaces directory"""
+        return self._load_yaml_category("interfaces")
+    
+    def _read_markdown_file(self, md_file):
+        self.load_counts['markdown'] += 1
+        try:
+            with open(md_file, 'r') as f:
+                return self.content_store.intern(f.read())
+        except Exception as e:
+            print(f"Error reading {md_file}: {e}")
+            return None
+    
+    def load_markdown_content(self):
+        """Load markdown content files"""
+        content_dir = self.base_path / "content"
+        md_files = self._markdown_files()
+        
+        if self.lazy:
+            return LazyFileMapping(
+                {str(md_file.relative_to(content_dir)): md_file for md_file in md_files},
+                lambda md_file: self._read_markdown_file(md_file) or ''
+            )
+        
+        if self.jobs > 1 and len(md_files) > 1:
+            # Reads are I/O bound, so threads are enough here
+            with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                texts = list(executor.map(self._read_markdown_file, md_files))
+        else:
+            texts = [self._read_markdown_file(md_file) for md_file in md_files]
+        
+        content_data = {}
+        for md_file, text in zip(md_files, texts):
+            if text is not None:
+                content_data[str(md_file.relative_to(content_dir))] = text
+        
+        return content_data
+    
+    def load_corpus(self):
+        """Parse every category and markdown file into a fresh ExportCorpus"""
+        self.load_counts['corpus_builds'] += 1
+        
+        if self.jobs <= 1 or self.lazy:
+            categories = {category: self._load_yaml_category(category) for category in ExportCorpus.CATEGORIES}
+            return ExportCorpus(content=self.load_markdown_content(),
+                                sources=self._source_mappings(categories), **categories)
+        
+        # Parallel: markdown reads overlap with one process-pool pass over every YAML file
+        with ThreadPoolExecutor(max_workers=1) as markdown_reader:
+            content_future = markdown_reader.submit(self.load_markdown_content)
+            
+            paths_by_category = {category: self._yaml_files(category) for category in ExportCorpus.CATEGORIES}
+            all_paths = [path for paths in paths_by_category.values() for path in paths]
+            parsed = iter(self._load_yaml_files(all_paths))
+            
+            categories = {}
+            for category, paths in paths_by_category.items():
+                categories[category] = {}
+                for yaml_file in paths:
+                    data = next(parsed)
+                    if data:
+                        categories[category][yaml_file.stem] = data
+            
+            return ExportCorpus(content=content_future.result(),
+                                sources=self._source_mappings(categories), **categories)
+    
+    def _yaml_source(self, yaml_file):
+        """Source text a YAML file was parsed from, parsing it first if it hasn't been"""
+        if yaml_file not in self._yaml_sources:
+            self.load_yaml_data(yaml_file)
+        return self._yaml_sources.get(yaml_file)
+    
+    def _source_mappings(self, categories):
+        """Lazy name -> source text mappings matching each loaded category"""
+        sources = {}
+        for category, category_data in categories.items():
+            paths = {yaml_file.stem: yaml_file for yaml_file in self._yaml_files(category)}
+            sources[category] = LazyFileMapping({name: paths[name] for name in category_data if name in paths},
+                                                self._yaml_source)
+        return sources
+    
+    def _embeddable_yaml(self, category, name, data):
+        """Source text for embedding; re-serializes only if the source is unavailable"""
+        source = self.corpus.source_text(category, name)
+        return source if source is not None else self._dump_yaml(data)
+    
+    @property
+    def corpus(self):
+        """The run's corpus snapshot, loaded on first use and shared afterwards
+        
+        A running target sees it through a TrackedCorpus bound to its build,
+        so the files it actually reads (on any thread) become its inputs.
+        """
+        if self._corpus is None:
+            with self._load_lock:
+                if self._corpus is None:
+                    self._corpus = self.load_corpus()
+        corpus = self._corpus
+        build = self._build
+        if build is None:
+            return corpus
+        if build.corpus is None or build.corpus.corpus is not corpus:
+            build.corpus = self._track_reads(corpus, build)
+        return build.corpus
+    
+    def _track_reads(self, corpus, build):
+        content_dir = self.base_path / "content"
+        paths = {category: {yaml_file.stem: yaml_file for yaml_file in self._yaml_files(category)}
+                 for category in ExportCorpus.CATEGORIES}
+        paths['content'] = {str(md_file.relative_to(content_dir)): md_file for md_file in self._markdown_files()}
+        dirs = {category: self.data_path / category for category in ExportCorpus.CATEGORIES}
+        dirs['content'] = content_dir
+        return TrackedCorpus(corpus, paths, dirs, build.inputs.add, build.listings.add)
+    
+    @property
+    def models(self):
+        """Typed card/boss/mentor models, built once from the corpus"""
+        corpus = self.corpus
+        if self._models is None:
+            with self._load_lock:
+                if self._models is None:
+                    loaded = self._corpus
+                    self._models = GameModels(loaded.cards, loaded.bosses, loaded.mentors)
+        if self._build is not None:
+            # Models summarize every card, boss and mentor file
+            corpus.read_all('cards', 'bosses', 'mentors')
+        return self._models
+    
+    @property
+    def path_index(self):
+        """Index of data/ and content/ used to resolve references in memory"""
+        if self._path_index is None:
+            with self._load_lock:
+                if self._path_index is None:
+                    self._path_index = PathIndex(self.base_path, on_missing=self._track_missing)
+        return self._path_index
+    
+    def _track_input(self, path):
+        if self._build is not None:
+            self._build.inputs.add(Path(path))
+    
+    def _track_listing(self, directory):
+        if self._build is not None:
+            self._build.listings.add(Path(directory))
+    
+    def _track_missing(self, path):
+        """A file a target looked for and didn't find: creating it must rebuild the target"""
+        self._track_input(path)
+    
+    def _track_output(self, path):
+        if self._build is not None:
+            self._build.outputs.append(Path(path))
+    
+    def _track_copied_tree(self, source_dir, dest_dir):
+        """A copied directory: its source files are inputs, the copy is an output"""
+        if self._build is None:
+            return
+        for dirpath, _, filenames in os.walk(source_dir):
+            self._build.inputs.update(Path(dirpath) / name for name in filenames)
+        self._build.outputs.append(Path(dest_dir))
+    
+    def _write_output(self, path, text):
+        """Write an output file through the output writer, recording it for the current target"""
+        self._track_output(path)
+        text = ''.join(self._fill_base_path((text,), self._base_path_offsets(path)))
+        return self.writer.write_text(path, text, owner=self._build)
+    
+    def _base_path_offsets(self, path):
+        """Fresh list for the offsets of the base path filled into output `path`"""
+        offsets = []
+        if self._build is not None:
+            self._build.base_path_offsets[Path(path)] = offsets
+        return offsets
+    
+    def _fill_base_path(self, chunks, offsets):
+        """Yield chunks with ARTIFACT_BASE_PATH_MARKER replaced by the checkout path,
+        appending the character offset of each replacement to offsets"""
+        checkout_path = str(self.base_path.absolute())
+        position = 0
+        for chunk in chunks:
+            if ARTIFACT_BASE_PATH_MARKER in chunk:
+                pieces = chunk.split(ARTIFACT_BASE_PATH_MARKER)
+                for piece in pieces[:-1]:
+                    position += len(piece)
+                    offsets.append(position)
+                    position += len(checkout_path)
+                chunk = checkout_path.join(pieces)
+                position += len(pieces[-1])
+            else:
+                position += len(chunk)
+            yield chunk
+    
+    def _get_template(self, name):
+        self._track_input(self.template_path / name)
+        return self.jinja_env.get_template(name)
+    
+    def template_variables(self, name):
+        """Top-level variables template `name` reads (jinja2.meta), or None if it
+        includes other templates; cached in memory and on disk by template source
+        hash, so an edited template (under --watch) is analyzed again"""
+        env = self.jinja_env
+        source, _, _ = env.loader.get_source(env, name)
+        digest = hashlib.sha256(source.encode('utf-8')).hexdigest()
+        with self._load_lock:
+            if digest in self._template_variables:
+                return self._template_variables[digest]
+        
+        cache_file = self.cache_path / "jinja" / f"variables-{digest[:40]}.json"
+        cached = False
+        if self.template_cache is not None:
+            # --no-cache analyzes every template afresh, like it compiles them
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+                variables = None if entry['variables'] is None else frozenset(entry['variables'])
+                cached = True
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+        
+        if not cached:
+            variables = None
+            meta = _heavy_import('jinja2.meta')
+            ast = env.parse(source)
+            if not list(meta.find_referenced_templates(ast)):
+                variables = frozenset(meta.find_undeclared_variables(ast))
+            if self.template_cache is not None:
+                _write_cache_file(cache_file, json.dumps({
+                    'template': name,
+                    'variables': None if variables is None else sorted(variables)
+                }).encode('utf-8'))
+        
+        with self._load_lock:
+            self._template_variables[digest] = variables
+        return variables
+    
+    def _template_values(self, template_name, template_context):
+        """What to render template_name with: only the variables it reads, for a lazy context"""
+        if isinstance(template_context, LazyTemplateContext):
+            return template_context.for_template(self.template_variables(template_name))
+        return template_context
+    
+    def _render_audience_documents(self, documents, template_context):
+        """Render (heading, template, output file, label) documents against one shared context
+        
+        With render_workers > 1 (and no streaming) the renders run in a process
+        pool: the values the templates read are computed here, where inputs are
+        tracked, and shipped to each worker once as plain data; only template
+        names and rendered text cross per document. Output is written, tracked
+        and reported here, in document order. With stream_renders each document
+        is written as it renders instead. Returns the files written.
+        """
+        prepared = []
+        for _, template_name, output_file, _ in documents:
+            try:
+                template = self._get_template(template_name)
+                values = self._template_values(template_name, template_context)
+                prepared.append((template, values, None))
+            except Exception as e:
+                prepared.append((None, None, e))
+        
+        renders = []
+        executor = None
+        ready = [values for template, values, error in prepared if error is None]
+        if self.render_workers > 1 and not self.stream_renders and len(ready) > 1:
+            context = {}
+            for values in ready:
+                context.update(values)
+            bytecode_dir = str(self.template_cache.cache_dir) if self.template_cache is not None else None
+            fragment_dir = str(self.fragment_cache.cache_dir) if self.fragment_cache is not None else None
+            executor = ProcessPoolExecutor(
+                max_workers=min(self.render_workers, len(ready)), mp_context=_process_context(),
+                initializer=_init_render_worker,
+                initargs=(str(self.template_path), bytecode_dir,
+                          self.template_cache.salt if self.template_cache is not None else '',
+                          fragment_dir, FRAGMENT_CACHE_MAX_MB * 1024 * 1024, _plain_data(context)))
+        
+        for (_, template_name, output_file, _), (template, values, error) in zip(documents, prepared):
+            if error is not None:
+                def render(error=error):
+                    raise error
+            elif executor is not None:
+                render = executor.submit(_render_template_worker, template_name).result
+            elif self.stream_renders:
+                def render(template=template, values=values, output_file=output_file):
+                    offsets = self._base_path_offsets(output_file)
+                    return self.writer.write_chunks(output_file,
+                                                    self._fill_base_path(template.generate(**values), offsets))
+            else:
+                render = lambda template=template, values=values: template.render(**values)
+            renders.append(render)
+        
+        generated_files = []
+        try:
+            for (heading, _, output_file, label), render in zip(documents, renders):
+                print(heading)
+                try:
+                    output = render()
+                    if executor is not None:
+                        output, hits, misses = output
+                        if self.fragment_cache is not None:
+                            self.fragment_cache.hits += hits
+                            self.fragment_cache.misses += misses
+                    if self.stream_renders:
+                        self._track_output(output_file)
+                    else:
+                        self._write_output(output_file, output)
+                    generated_files.append(output_file)
+                    print(f"✅ {label}: {output_file}")
+                except Exception as e:
+                    print(f"❌ Error generating {label.lower()}: {e}")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            if self.fragment_cache is not None:
+                self.fragment_cache.release()
+        return generated_files
+    
+    def _flush_writes(self, build):
+        """Barrier before a target's outputs are read back (manifest, artifact cache): raise if
+        any of its writes failed; other targets' pending writes and errors are left alone"""
+        self.writer.flush(build)
+        errors = self.writer.pop_errors(build)
+        if errors:
+            raise OSError("; ".join(f"failed to write {path}: {error}" for path, error in errors))
+    
+    def run_target(self, target, options, build, *args):
+        """Run build(*args) as export target `target`, unless the manifest shows it up to date"""
+        options = dict(options, base_path=str(self.base_path.resolve()))
+        
+        if not self.force and self.manifest.is_fresh(target, options):
+            self.manifest.up_to_date.append(target)
+            self.manifest.save()
+            print(f"✅ {target} is up to date, skipping (use --force to rebuild)")
+            return None
+        
+        # --copy-to writes outside the tree, so those runs always render locally
+        artifact_key = None
+        if self.artifacts is not None and not options.get('copy_to'):
+            portable_options = {name: value for name, value in options.items() if name != 'base_path'}
+            artifact_key = self.artifacts.key(target, portable_options, self.base_path)
+            artifact = None if self.force else self.artifacts.fetch(artifact_key)
+            if artifact is not None:
+                self._restore_artifact(target, options, artifact)
+                return None
+        
+        self._build = TargetBuild()
+        try:
+            result = build(*args)
+            target_build = self._build
+        finally:
+            self._build = None
+        self._flush_writes(target_build)
+        
+        self.manifest.built.append(target)
+        self.last_build = target_build
+        if target_build.outputs:
+            # The exporter itself is an input: changing it invalidates every target
+            target_build.inputs.add(Path(__file__))
+            self.manifest.record(target, options, target_build)
+            self.manifest.save()
+            if artifact_key is not None:
+                self.artifacts.store(artifact_key, self._artifact_for(target_build))
+        return result
+    
+    def _artifact_for(self, target_build):
+        """Serializable outputs (as text) and input list of a finished target"""
+        base = self.base_path.resolve()
+        checkout_path = str(self.base_path.absolute())
+        outputs = {}
+        for path in target_build.outputs:
+            with open(path, 'r', encoding='utf-8', newline='') as f:
+                text = f.read()
+            # Only the spots the base path was rendered into; the same string elsewhere stays as is
+            for offset in reversed(target_build.base_path_offsets.get(Path(path), ())):
+                text = text[:offset] + ARTIFACT_BASE_PATH_MARKER + text[offset + len(checkout_path):]
+            outputs[Path(os.path.relpath(os.path.abspath(path), base)).as_posix()] = text
+        return {
+            'outputs': outputs,
+            'inputs': sorted(Path(os.path.relpath(os.path.abspath(path), base)).as_posix()
+                             for path in target_build.inputs),
+            'listings': sorted(Path(os.path.relpath(os.path.abspath(path), base)).as_posix()
+                               for path in target_build.listings)
+        }
     
-    def load_yaml_data(self, file_path):
-        """Load YAML data from file"""
+    def _restore_artifact(self, target, options, artifact):
+        """Write a cached target's outputs and record it in the manifest as if just built"""
+        self._build = TargetBuild()
         try:
-            with open(file_path, 'r') as f:
-                return yaml.safe_load(f)
-        except FileNotFoundError:
-            print(f"Warning: {file_path} not found")
-            return {}
-        except yaml.YAMLError as e:
-            print(f"Error parsing YAML {file_path}: {e}")
-            return {}
+            for rel_path, text in artifact['outputs'].items():
+                output_path = self.base_path / rel_path
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                # _write_output fills the marker in with this checkout's path
+                self._write_output(output_path, text)
+            target_build = self._build
+        finally:
+            self._build = None
+        self._flush_writes(target_build)
+        
+        target_build.inputs.update(self.base_path / rel_path for rel_path in artifact['inputs'])
+        target_build.listings.update(self.base_path / rel_path for rel_path in artifact['listings'])
+        self.manifest.restored.append(target)
+        self.manifest.record(target, options, target_build)
+        self.manifest.save()
+        print(f"♻️ {target} restored from artifact cache ({len(artifact['outputs'])} files)")
     
-    def load_all_cards(self):
-        """Load all card data from the cards directory"""
-        cards_data = {}
-        cards_dir = self.data_path / "cards"
-        
-        if cards_dir.exists():
-            for yaml_file in cards_dir.glob("*.yaml"):
-                system_name = yaml_file.stem
-                data = self.load_yaml_data(yaml_file)
-                if data:
-                    cards_data[system_name] = data
-        
-        return cards_data
+    def workflow_systems(self, system_arg):
+        """Interfaces named by --system: None (first interface), 'all', or a comma-separated list"""
+        if system_arg is None:
+            return [None]
+        if system_arg == 'all':
+            return list(self.corpus.interfaces)
+        return [name.strip() for name in system_arg.split(',') if name.strip()]
     
-    def load_all_bosses(self):
-        """Load all boss data from the bosses directory"""
-        bosses_data = {}
-        bosses_dir = self.data_path / "bosses"
-        
-        if bosses_dir.exists():
-            for yaml_file in bosses_dir.glob("*.yaml"):
-                boss_name = yaml_file.stem
-                data = self.load_yaml_data(yaml_file)
-                if data:
-                    bosses_data[boss_name] = data
+    def export_all(self, max_workers=3):
+        """🗓️ nextjs, claude and visual as a task graph over one shared corpus 🗓️
+        
+        The formats only share the corpus (loaded once by the first task, and
+        only if some format is out of date) and write disjoint files, so they
+        run concurrently on up to max_workers threads.
+        """
+        nextjs_files = {f"rogue-docs-web/data/{data_type}.json"
+                        for data_type in ExportCorpus.CATEGORIES + ('content',)}
+        formats = [
+            ('nextjs', self.export_for_nextjs, nextjs_files),
+            ('claude', self.export_claude_context, {"exports/claude-context.md"}),
+            ('visual', self.export_visual_relationship_maps, {
+                "exports/constellation-map.mmd", "exports/hierarchy-map.mmd",
+                "exports/system-constellation.html", "rogue-docs-web/data/relationships.json",
+                *(f"exports/focused-{system}-map.mmd" for system in FOCUSED_MAP_SYSTEMS)
+            })
+        ]
         
-        return bosses_data
-    
-    def load_all_mentors(self):
-        """Load all mentor data from the mentors directory"""
-        mentors_data = {}
-        mentors_dir = self.data_path / "mentors"
+        def load_corpus():
+            base_path = str(self.base_path.resolve())
+            if self.force or not all(self.manifest.is_fresh(name, {'base_path': base_path}) for name, _, _ in formats):
+                self.corpus
         
-        if mentors_dir.exists():
-            for yaml_file in mentors_dir.glob("*.yaml"):
-                system_name = yaml_file.stem
-                data = self.load_yaml_data(yaml_file)
-                if data:
-                    mentors_data[system_name] = data
+        scheduler = TaskScheduler(max_workers)
+        scheduler.add('corpus', load_corpus, outputs={'corpus'})
+        for name, build, outputs in formats:
+            scheduler.add(name, lambda name=name, build=build: self.run_target(name, {}, build),
+                          inputs={'corpus'}, outputs=outputs)
         
-        return mentors_data
+        failed = scheduler.run()
+        print(scheduler.report())
+        return failed
     
-    def load_all_constants(self):
-        """Load all constant data from the constants directory"""
-        constants_data = {}
-        constants_dir = self.data_path / "constants"
-        
-        if constants_dir.exists():
-            for yaml_file in constants_dir.glob("*.yaml"):
-                system_name = yaml_file.stem
-                data = self.load_yaml_data(yaml_file)
-                if data:
-                    constants_data[system_name] = data
-        
-        return constants_data
+    def _run_batch_target(self, target, options, build, *args):
+        """run_target() for one member of a batch: returns its status instead of raising"""
+        try:
+            generated = self.run_target(target, options, build, *args)
+        except Exception as e:
+            print(f"❌ {target} failed: {e}")
+            return 'failed'
+        if target in self.manifest.up_to_date:
+            return 'up to date'
+        if target in self.manifest.restored:
+            return 'restored'
+        if generated and self.last_build.outputs:
+            return 'rendered'
+        # Unknown system, or every document failed to render
+        return 'failed'
     
-    def load_all_interfaces(self):
-        """Load all interface data from the interfaces directory"""
-        interfaces_data = {}
-        interfaces_dir = self.data_path / "interfaces"
-        
-        if interfaces_dir.exists():
-            for yaml_file in interfaces_dir.glob("*.yaml"):
-                system_name = yaml_file.stem
-                data = self.load_yaml_data(yaml_file)
-                if data:
-                    interfaces_data[system_name] = data
-        
-        return interfaces_data
+    def _batch_summary(self, label, noun, results, seconds):
+        icons = {'rendered': '✅', 'up to date': '✅', 'restored': '♻️', 'failed': '❌'}
+        counts = {}
+        for _, status, _ in results:
+            counts[status] = counts.get(status, 0) + 1
+        totals = ', '.join(f"{count} {status}" for status, count in counts.items())
+        lines = [f"\n📦 {label}: {len(results)} {noun} in {seconds:.2f}s ({totals})"]
+        lines.extend(f"  {icons[status]} {name}: {status} ({elapsed:.2f}s)"
+                     for name, status, elapsed in results)
+        return "\n".join(lines)
     
-    def load_markdown_content(self):
-        """Load markdown content files"""
-        content_data = {}
+    def export_workflow_batch(self, system_names, include_archives=False, copy_to=None, export_references=False):
+        """🎯 Three-audience workflow for several systems over one corpus, each its own target 🎯
+        
+        A failing system is reported and the rest still render. With --copy-to
+        and more than one system, each system is copied into its own
+        <copy_to>/<system>/ so READMEs and references don't overwrite each other.
+        """
+        batch = len(system_names) > 1
+        results = []
+        batch_start = time.perf_counter()
+        
+        for system_name in system_names:
+            system_copy_to = str(Path(copy_to) / system_name) if copy_to and batch else copy_to
+            options = {
+                'include_archives': include_archives,
+                'copy_to': system_copy_to,
+                'export_references': export_references
+            }
+            start = time.perf_counter()
+            status = self._run_batch_target(f"workflow:{system_name or 'default'}", options,
+                                            self.export_three_audience_workflow,
+                                            system_name, include_archives, system_copy_to, export_references)
+            results.append((system_name, status, time.perf_counter() - start))
+        
+        if batch:
+            print(self._batch_summary("Workflow batch", "systems", results, time.perf_counter() - batch_start))
+        return results
+    
+    def export_narrative_batch(self, focus_areas, include_archives=False, copy_to=None, export_references=False):
+        """🎭 Narrative workflow for several focus areas in one pass over one shared narrative base 🎭
+        
+        Each focus area is its own target; the per-corpus pieces they share
+        (structured mentors, boss characters, character arcs, embedded
+        systems) are built once, see _narrative_memo. With --copy-to and more
+        than one focus area, each is copied into <copy_to>/<focus_area>/.
+        """
+        batch = len(focus_areas) > 1
+        results = []
+        batch_start = time.perf_counter()
+        
+        for focus_area in focus_areas:
+            focus_copy_to = str(Path(copy_to) / (focus_area or 'all')) if copy_to and batch else copy_to
+            options = {
+                'include_archives': include_archives,
+                'copy_to': focus_copy_to,
+                'export_references': export_references
+            }
+            start = time.perf_counter()
+            status = self._run_batch_target(f"narrative:{focus_area or 'all'}", options,
+                                            self.export_narrative_workflow,
+                                            focus_area, include_archives, focus_copy_to, export_references)
+            results.append((focus_area, status, time.perf_counter() - start))
+        
+        if batch:
+            print(self._batch_summary("Narrative batch", "focus areas", results, time.perf_counter() - batch_start))
+        return results
+    
+    @property
+    def matrix_path(self):
+        return self.base_path / "exports" / "matrix"
+    
+    def matrix_timings_file(self, timings_file=None):
+        return Path(timings_file) if timings_file else self.cache_path / "matrix-timings.json"
+    
+    def matrix_jobs(self):
+        """Every interface in every mode, plus one narrative job per focus area, in a fixed order"""
+        jobs = [MatrixJob('workflow', system_name, mode)
+                for system_name in sorted(self.corpus.interfaces) for mode in MATRIX_MODES]
+        jobs.extend(MatrixJob('narrative', focus_area, 'embedded') for focus_area in NARRATIVE_FOCUS_AREAS)
+        return jobs
+    
+    def matrix_shard(self, shard=(1, 1), timings_file=None):
+        """(jobs of this shard, its estimated seconds, total job count)"""
+        index, count = shard
+        jobs = self.matrix_jobs()
+        timings = _read_json_file(self.matrix_timings_file(timings_file), {})
+        shards, loads = assign_shards(jobs, count, timings)
+        return shards[index - 1], loads[index - 1], len(jobs)
+    
+    def list_matrix_jobs(self, shard=(1, 1), timings_file=None):
+        jobs, load, total = self.matrix_shard(shard, timings_file)
+        lines = [f"🧮 Shard {shard[0]}/{shard[1]}: {len(jobs)} of {total} jobs (~{load:.2f}s estimated)"]
+        lines.extend(f"  {job.name}" for job in jobs)
+        return "\n".join(lines)
+    
+    def run_matrix(self, shard=(1, 1), timings_file=None):
+        """🧮 Render this shard's matrix jobs into exports/matrix/<mode>/ and write its shard manifest 🧮
+        
+        Returns the names of the jobs that failed; they are listed as failed
+        in the shard manifest rather than with outputs.
+        """
+        index, count = shard
+        jobs, load, total = self.matrix_shard(shard, timings_file)
+        print(f"🧮 Export matrix: shard {index}/{count} runs {len(jobs)} of {total} jobs (~{load:.2f}s estimated)")
+        
+        measured = {}
+        failed = []
+        export_path = self.export_path
+        try:
+            for job in jobs:
+                self.export_path = self.matrix_path / job.mode
+                self.export_path.mkdir(parents=True, exist_ok=True)
+                
+                build = self.export_three_audience_workflow if job.kind == 'workflow' else self.export_narrative_workflow
+                start = time.perf_counter()
+                status = self._run_batch_target(job.name, job.options, build, job.subject,
+                                                job.options['include_archives'], None, job.options['export_references'])
+                if status == 'failed':
+                    failed.append(job.name)
+                elif status == 'rendered':
+                    # Skipped, restored or failed jobs say nothing about render time
+                    measured[job.name] = time.perf_counter() - start
+        finally:
+            self.export_path = export_path
+        
+        outputs = {}
+        for job in jobs:
+            if job.name in failed:
+                continue
+            recorded = self.manifest.targets.get(job.name, {}).get('outputs', {})
+            outputs[job.name] = sorted(os.path.relpath(self.base_path / key, self.matrix_path) for key in recorded)
+        
+        # An empty shard renders nothing but still reports in
+        self.matrix_path.mkdir(parents=True, exist_ok=True)
+        shard_manifest = self.matrix_path / f"shard-{index}-of-{count}.json"
+        self.writer.write_text(shard_manifest, json.dumps({
+            'shard': [index, count],
+            'jobs': [job.name for job in jobs],
+            'timings': measured,
+            'outputs': outputs,
+            'failed': failed
+        }, indent=2, sort_keys=True))
+        # Sharded nodes must all balance on the same timings, so only an
+        # unsharded run (or --merge-shards) updates the timings file
+        if count == 1:
+            self._update_matrix_timings(measured, timings_file)
+        print(f"🧾 Shard manifest: {shard_manifest}")
+        if failed:
+            print(f"❌ {len(failed)} matrix jobs failed: {', '.join(failed)}")
+        return failed
+    
+    def _update_matrix_timings(self, measured, timings_file=None):
+        if not measured:
+            return
+        timings_path = self.matrix_timings_file(timings_file)
+        timings = _read_json_file(timings_path, {})
+        timings.update(measured)
+        timings_path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write_bytes(timings_path, json.dumps(timings, indent=2, sort_keys=True).encode('utf-8'))
+    
+    def merge_matrix_shards(self, shard_dirs, timings_file=None):
+        """🧩 Collect shard outputs (exports/matrix/ trees from each node) into this exports/matrix/ 🧩
+        
+        Returns the matrix jobs without merged outputs, failed ones included.
+        """
+        self.matrix_path.mkdir(parents=True, exist_ok=True)
+        
+        merged_outputs = {}
+        failed = set()
+        shards = []
+        timings = {}
+        for shard_dir in shard_dirs:
+            shard_dir = Path(shard_dir)
+            shard_files = sorted(shard_dir.glob("shard-*-of-*.json"))
+            if not shard_files:
+                print(f"⚠️ No shard manifests in {shard_dir}")
+            for shard_file in shard_files:
+                shard = _read_json_file(shard_file, None)
+                if not shard:
+                    print(f"❌ Unreadable shard manifest: {shard_file}")
+                    continue
+                shards.append(shard['shard'])
+                timings.update(shard['timings'])
+                failed.update(shard.get('failed', ()))
+                for job_name, files in shard['outputs'].items():
+                    if job_name in merged_outputs:
+                        print(f"⚠️ {job_name} appears in more than one shard; keeping {shard_file.name}")
+                    for rel_path in files:
+                        dest = self.matrix_path / rel_path
+                        dest.parent.mkdir(parents=True, exist_ok=True)
+                        self.writer.copy_file(shard_dir / rel_path, dest)
+                    merged_outputs[job_name] = files
+        
+        # A job that failed on one node but rendered on another (a re-run shard) is merged
+        failed -= merged_outputs.keys()
+        missing = [job.name for job in self.matrix_jobs() if job.name not in merged_outputs]
+        self.writer.write_text(self.matrix_path / "matrix-manifest.json", json.dumps({
+            'shards': sorted(shards),
+            'outputs': merged_outputs,
+            'failed': sorted(failed),
+            'missing': missing
+        }, indent=2, sort_keys=True))
+        self._update_matrix_timings(timings, timings_file)
+        
+        print(f"🧩 Merged {len(shards)} shards: {len(merged_outputs)} jobs into {self.matrix_path}")
+        if failed:
+            print(f"❌ {len(failed)} matrix jobs failed on their shard: {', '.join(sorted(failed))}")
+        absent = [name for name in missing if name not in failed]
+        if absent:
+            print(f"⚠️ {len(absent)} matrix jobs missing from the shards: {', '.join(absent)}")
+        return missing
+    
+    def refresh_corpus(self):
+        """Drop the current snapshot so the next access reloads from disk"""
+        self._corpus = None
+        self._models = None
+        self._path_index = None
+        self.content_store.retain(())
+    
+    def _reload_category(self, category, current, changed):
+        """Category data in listing order, parsing only changed or new files"""
+        if self.lazy:
+            return self._load_yaml_category(category)
+        data = {}
+        for yaml_file in self._yaml_files(category):
+            if yaml_file in changed or yaml_file.stem not in current:
+                value = self.load_yaml_data(yaml_file)
+            else:
+                value = current[yaml_file.stem]
+            if value:
+                data[yaml_file.stem] = value
+        return data
+    
+    def _reload_markdown(self, current, changed):
+        """Markdown content in listing order, reading only changed or new files"""
+        if self.lazy:
+            return self.load_markdown_content()
         content_dir = self.base_path / "content"
+        content_data = {}
+        for md_file in self._markdown_files():
+            key = str(md_file.relative_to(content_dir))
+            text = self._read_markdown_file(md_file) if md_file in changed or key not in current else current[key]
+            if text is not None:
+                content_data[key] = text
+        return content_data
+    
+    def apply_changes(self, changed_paths):
+        """Update the warm corpus for changed/added/removed files without reloading the rest"""
+        changed = {Path(path) for path in changed_paths}
+        self._path_index = None
+        self._models = None
+        if self._corpus is None:
+            return
         
-        if content_dir.exists():
-            for md_file in content_dir.rglob("*.md"):
-                relative_path = md_file.relative_to(content_dir)
-                try:
-                    with open(md_file, 'r') as f:
-                        content_data[str(relative_path)] = f.read()
-                except Exception as e:
-                    print(f"Error reading {md_file}: {e}")
+        corpus = self._corpus
+        changed_categories = {path.parent.name for path in changed
+                              if path.suffix == '.yaml' and path.parent.parent == self.data_path}
+        categories = {category: self._reload_category(category, getattr(corpus, category), changed)
+                      for category in ExportCorpus.CATEGORIES if category in changed_categories}
         
-        return content_data
+        content_dir = self.base_path / "content"
+        content = None
+        if any(path.suffix == '.md' and content_dir in path.parents for path in changed):
+            content = self._reload_markdown(corpus.content, changed)
+        
+        if categories or content is not None:
+            # Source text is memoized per category, so changed categories get fresh mappings
+            self._corpus = corpus.replace(categories=categories, content=content,
+                                          sources=self._source_mappings(categories))
+        # Bodies of edited or deleted files would otherwise stay pinned all session
+        self.content_store.retain(() if self.lazy else self._corpus.content.values())
+    
+    def _watch_snapshot(self):
+        """(mtime_ns, size) of every file under the watched directories"""
+        snapshot = {}
+        for root in WATCH_ROOTS:
+            for dirpath, _, filenames in os.walk(self.base_path / root):
+                for name in filenames:
+                    path = os.path.join(dirpath, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+    
+    def watch(self, run_targets, interval=0.5):
+        """👀 Poll data/, content/ and templates/ and re-run run_targets() after each change 👀"""
+        # Warm the corpus up front so the first change only costs the changed file
+        self.corpus
+        snapshot = self._watch_snapshot()
+        print(f"👀 Watching {', '.join(f'{root}/' for root in WATCH_ROOTS)} for changes (Ctrl+C to stop)...")
+        
+        try:
+            while True:
+                time.sleep(interval)
+                current = self._watch_snapshot()
+                if current == snapshot:
+                    continue
+                changed = sorted(path for path in snapshot.keys() | current.keys()
+                                 if snapshot.get(path) != current.get(path))
+                snapshot = current
+                
+                start = time.perf_counter()
+                names = ', '.join(os.path.relpath(path, self.base_path) for path in changed)
+                print(f"\n🔄 Changed: {names}")
+                recorded = set(self.manifest.targets)
+                affected = self.manifest.affected_by(changed)
+                self.apply_changes(changed)
+                self.unresolved_references.clear()
+                self.manifest.built.clear()
+                self.manifest.restored.clear()
+                self.manifest.up_to_date.clear()
+                run_targets()
+                print(self.manifest.summary())
+                # An edit must only rebuild the targets that read the edited file
+                unexpected = [target for target in self.manifest.built if target in recorded - affected]
+                if unexpected and not self.force:
+                    print(f"⚠️ Rebuilt although none of their recorded inputs changed: {', '.join(unexpected)}")
+                print(f"⚡ Re-exported in {(time.perf_counter() - start) * 1000:.0f} ms")
+        except KeyboardInterrupt:
+            print("\n👋 Stopped watching")
+    
+    def load_summary(self):
+        counts = self.load_counts
+        return (f"📚 Corpus loaded {counts['corpus_builds']}x this run: "
+                f"{counts['yaml']} YAML loads, {counts['markdown']} markdown reads")
     
     def clean_string_for_js(self, text):
         """Clean strings aggressively for Mermaid compatibility"""
@@ -148,27 +2803,10 @@ class DocumentationExporter:
     def generate_constellation_map(self):
         """🌟 Generate a simple, bulletproof constellation map! 🌟"""
         
-        # Load all system data
-        all_systems = {
-            **self.load_all_constants(),
-            **self.load_all_bosses(), 
-            **self.load_all_mentors(),
-            **self.load_all_cards()
-        }
+        all_systems = self.corpus.systems
         
         # Simple priority mapping
-        priorities = {}
-        for system_name, system_data in all_systems.items():
-            if 'boss_encounter' in system_data or system_data.get('system_info', {}).get('type') == 'boss_encounter':
-                priorities[system_name] = 'boss'
-            elif 'mentor' in system_name or 'mentors' in system_data:
-                priorities[system_name] = 'mentor'
-            elif 'constellation' in system_name.lower():
-                priorities[system_name] = 'core'
-            elif any(keyword in system_name.lower() for keyword in ['pico', 'amara', 'journal']):
-                priorities[system_name] = 'narrative'
-            else:
-                priorities[system_name] = 'system'
+        priorities = self.corpus.system_priorities
         
         # Generate super-simple Mermaid
         mermaid_lines = [
@@ -232,12 +2870,7 @@ class DocumentationExporter:
     def generate_focused_system_map(self, focus_system):
         """🎯 Generate a simple focused system view! 🎯"""
         
-        all_systems = {
-            **self.load_all_constants(),
-            **self.load_all_bosses(),
-            **self.load_all_mentors(), 
-            **self.load_all_cards()
-        }
+        all_systems = self.corpus.systems
         
         if focus_system not in all_systems:
             return f"graph TD\n    error(System Not Found)"
@@ -275,35 +2908,8 @@ class DocumentationExporter:
     def generate_priority_hierarchy_map(self):
         """🚀 Generate a beautiful priority-based hierarchy view! 🚀"""
         
-        all_systems = {
-            **self.load_all_constants(),
-            **self.load_all_bosses(),
-            **self.load_all_mentors(),
-            **self.load_all_cards()
-        }
-        
         # Categorize systems by priority and type
-        categories = {
-            'core': [],
-            'bosses': [],
-            'mentors': [], 
-            'narrative': [],
-            'systems': []
-        }
-        
-        for system_name, system_data in all_systems.items():
-            system_info = system_data.get('system_info', {})
-            
-            if 'constellation' in system_name.lower() or 'phenomenon' in system_name.lower():
-                categories['core'].append(system_name)
-            elif 'boss_encounter' in system_data or system_info.get('type') == 'boss_encounter':
-                categories['bosses'].append(system_name)
-            elif 'mentor' in system_name or 'mentors' in system_data:
-                categories['mentors'].append(system_name)
-            elif any(keyword in system_name.lower() for keyword in ['pico', 'amara', 'journal']):
-                categories['narrative'].append(system_name)
-            else:
-                categories['systems'].append(system_name)
+        categories = self.corpus.hierarchy_categories
         
         mermaid_lines = [
             "graph TD",
@@ -357,12 +2963,7 @@ class DocumentationExporter:
     def generate_system_metrics(self):
         """📊 Generate implementation metrics and status data! 📊"""
         
-        all_systems = {
-            **self.load_all_constants(),
-            **self.load_all_bosses(),
-            **self.load_all_mentors(),
-            **self.load_all_cards()
-        }
+        all_systems = self.corpus.systems
         
         metrics = {}
         
@@ -467,28 +3068,24 @@ class DocumentationExporter:
         # Generate the magnificent constellation map
         constellation_map = self.generate_constellation_map()
         constellation_file = self.export_path / "constellation-map.mmd"
-        with open(constellation_file, 'w') as f:
-            f.write(constellation_map)
+        self._write_output(constellation_file, constellation_map)
         print(f"✨ Generated Constellation Map: {constellation_file}")
         
         # Generate hierarchy map
         hierarchy_map = self.generate_priority_hierarchy_map()
         hierarchy_file = self.export_path / "hierarchy-map.mmd" 
-        with open(hierarchy_file, 'w') as f:
-            f.write(hierarchy_map)
+        self._write_output(hierarchy_file, hierarchy_map)
         print(f"🚀 Generated Hierarchy Map: {hierarchy_file}")
         
         # Generate focused maps for key systems
-        key_systems = ['pico-character', 'constellation-phenomenon', 'amara-narrative', 'journal-system']
-        
-        for system in key_systems:
+        for system in FOCUSED_MAP_SYSTEMS:
             focused_map = self.generate_focused_system_map(system)
             if "not found" not in focused_map:
                 focused_file = self.export_path / f"focused-{system}-map.mmd"
-                with open(focused_file, 'w') as f:
-                    f.write(focused_map)
+                self._write_output(focused_file, focused_map)
                 print(f"🎯 Generated Focused Map for {system}: {focused_file}")
         
+        
         # Create the AMAZING interactive HTML file! 🌟✨
         html_content = f"""
 <!DOCTYPE html>
@@ -1323,8 +3920,7 @@ class DocumentationExporter:
 """
         
         html_file = self.export_path / "system-constellation.html"
-        with open(html_file, 'w') as f:
-            f.write(html_content)
+        self._write_output(html_file, html_content)
         print(f"🌟 Generated Interactive Constellation Viewer: {html_file}")
         
         # Also export for Next.js integration
@@ -1337,8 +3933,7 @@ class DocumentationExporter:
         nextjs_viz_path = self.rogue_docs_web_path / "data"
         nextjs_viz_path.mkdir(exist_ok=True)
         
-        with open(nextjs_viz_path / "relationships.json", 'w') as f:
-            json.dump(relationship_data, f, indent=2)
+        self._write_output(nextjs_viz_path / "relationships.json", json.dumps(relationship_data, indent=2))
         print(f"💎 Exported relationship data for Next.js: {nextjs_viz_path / 'relationships.json'}")
         
         return {
@@ -1349,14 +3944,16 @@ class DocumentationExporter:
     
     def export_for_nextjs(self):
         """Export data as JSON for Next.js consumption"""
-        # Load all data
+        
+        # Plain dicts so json can serialize them
+        corpus = self.corpus
         all_data = {
-            "cards": self.load_all_cards(),
-            "bosses": self.load_all_bosses(),
-            "mentors": self.load_all_mentors(),
-            "constants": self.load_all_constants(),
-            "interfaces": self.load_all_interfaces(),
-            "content": self.load_markdown_content()
+            "cards": dict(corpus.cards),
+            "bosses": dict(corpus.bosses),
+            "mentors": dict(corpus.mentors),
+            "constants": dict(corpus.constants),
+            "interfaces": dict(corpus.interfaces),
+            "content": dict(corpus.content)
         }
         
         # Export to rogue-docs-web/data directory for Next.js
@@ -1366,20 +3963,20 @@ class DocumentationExporter:
         # Write all data as separate files
         for data_type, data in all_data.items():
             if data:  # Only write if data exists
-                with open(nextjs_data_path / f"{data_type}.json", 'w') as f:
-                    json.dump(data, f, indent=2)
+                self._write_output(nextjs_data_path / f"{data_type}.json", json.dumps(data, indent=2))
                 print(f"Exported {data_type} data to {nextjs_data_path / data_type}.json")
         
         return all_data
     
     def export_claude_context(self):
         """Export comprehensive context for Claude conversations"""
-        # Load all data
-        cards_data = self.load_all_cards()
-        bosses_data = self.load_all_bosses()
-        mentors_data = self.load_all_mentors()
-        constants_data = self.load_all_constants()
-        content_data = self.load_markdown_content()
+        corpus = self.corpus
+        models = self.models
+        cards_data = corpus.cards
+        bosses_data = corpus.bosses
+        mentors_data = corpus.mentors
+        constants_data = corpus.constants
+        content_data = corpus.content
         
         output = ["# Rogue Resident Complete System - Claude Context\n"]
         output.append("**Generated from structured YAML + Markdown documentation system**\n")
@@ -1388,13 +3985,13 @@ class DocumentationExporter:
         if bosses_data:
             output.append("## Boss Encounters\n")
             for boss_name, boss_data in bosses_data.items():
-                system_info = boss_data.get('system_info', {})
-                output.append(f"### {system_info.get('name', boss_name)}")
-                output.append(f"**Type**: {system_info.get('type', 'N/A')}")
-                output.append(f"**Difficulty**: {system_info.get('difficulty', 'N/A')}")
-                output.append(f"**Season**: {system_info.get('season_availability', 'N/A')}")
-                output.append(f"**Duration**: {system_info.get('estimated_duration', 'N/A')}")
-                output.append(f"**Mastery Required**: {system_info.get('mastery_threshold', 'N/A')}%")
+                boss = models.bosses[boss_name]
+                output.append(f"### {boss.name}")
+                output.append(f"**Type**: {boss.encounter_type}")
+                output.append(f"**Difficulty**: {boss.difficulty}")
+                output.append(f"**Season**: {boss.season}")
+                output.append(f"**Duration**: {boss.duration}")
+                output.append(f"**Mastery Required**: {boss.mastery_threshold}%")
                 
                 # Character data - flexible parsing
                 char_data = boss_data.get('character_data', {})
@@ -1464,50 +4061,41 @@ class DocumentationExporter:
                     output.append(f"**SP Reward**: {sp_reward}")
                 
                 # Cross-references
-                cross_refs = boss_data.get('cross_references', {})
-                if cross_refs:
-                    related_systems = cross_refs.get('related_systems', [])
-                    if related_systems:
-                        output.append(f"**Related Systems**: {', '.join(related_systems)}")
+                if boss.related_systems:
+                    output.append(f"**Related Systems**: {', '.join(boss.related_systems)}")
                 
                 output.append(f"**See**: `content/character-arcs/{boss_name}.md` for complete narrative\n")
         
         # Mentors Section - FIXED to parse actual data structure
         if mentors_data:
             output.append("## Mentors\n")
-            mentors = mentors_data.get('mentors', {}).get('mentors', {})
-            for mentor_id, mentor in mentors.items():
-                output.append(f"### {mentor.get('full_name', mentor_id)}")
-                output.append(f"**Title**: {mentor.get('title', 'N/A')}")
-                output.append(f"**Role**: {mentor.get('role', 'N/A')}")
-                output.append(f"**Domain**: {mentor.get('domain_expertise', 'N/A')}")
-                output.append(f"**Archetype**: {mentor.get('personality_archetype', 'N/A')}")
+            for mentor in models.mentor_files.get('mentors', ()):
+                output.append(f"### {mentor.full_name}")
+                output.append(f"**Title**: {mentor.title}")
+                output.append(f"**Role**: {mentor.role}")
+                output.append(f"**Domain**: {mentor.domain}")
+                output.append(f"**Archetype**: {mentor.archetype}")
                 
                 # Character traits
-                traits = mentor.get('character_traits', {})
-                if traits:
-                    output.append(f"**Teaching Style**: {traits.get('teaching_style', 'N/A')}")
-                    output.append(f"**Communication**: {traits.get('communication_style', 'N/A')}")
+                if mentor.teaching_style is not None:
+                    output.append(f"**Teaching Style**: {mentor.teaching_style}")
+                    output.append(f"**Communication**: {mentor.communication_style}")
                 
                 # Domain focus
-                domain_focus = mentor.get('domain_focus', {})
-                if domain_focus:
-                    output.append(f"**Primary Domain**: {domain_focus.get('primary_domain', 'N/A')}")
-                    primary_stars = domain_focus.get('primary_stars', [])
-                    if primary_stars:
-                        output.append(f"**Primary Stars**: {', '.join(primary_stars)}")
+                if mentor.primary_domain is not None:
+                    output.append(f"**Primary Domain**: {mentor.primary_domain}")
+                    if mentor.primary_stars:
+                        output.append(f"**Primary Stars**: {', '.join(mentor.primary_stars)}")
                 
                 # Dialogue themes
-                dialogue_themes = mentor.get('dialogue_themes', [])
-                if dialogue_themes:
+                if mentor.dialogue_themes:
                     output.append("**Key Dialogue Themes**:")
-                    for theme in dialogue_themes[:3]:  # Show first 3 themes
+                    for theme in mentor.dialogue_themes[:3]:  # Show first 3 themes
                         output.append(f"- {theme.replace('_', ' ').title()}")
                 
                 # Special significance
-                special_sig = mentor.get('special_significance', {})
-                if special_sig:
-                    for key, value in special_sig.items():
+                if mentor.special_significance:
+                    for key, value in mentor.special_significance:
                         if isinstance(value, bool) and value:
                             output.append(f"**Special Role**: {key.replace('_', ' ').title()}")
                         elif isinstance(value, str):
@@ -1573,75 +4161,35 @@ class DocumentationExporter:
                     'cross_domain_cards': 'Cross-Domain Cards'
                 }
                 
+                card_system = models.card_systems[system_name]
                 total_cards_shown = 0
                 for domain_key, domain_name in domain_sections.items():
-                    domain_cards = system_data.get(domain_key, {})
-                    if domain_cards and total_cards_shown < 12:  # Limit total cards shown
+                    if domain_key in card_system.sections and total_cards_shown < 12:  # Limit total cards shown
                         output.append(f"\n**{domain_name}**:")
                         
-                        # Show high priority cards first
-                        high_priority_cards = []
-                        other_cards = []
-                        
-                        for card_id, card_data in domain_cards.items():
-                            if isinstance(card_data, dict):
-                                priority = card_data.get('implementation_priority', 'medium')
-                                if priority == 'high':
-                                    high_priority_cards.append((card_id, card_data))
-                                else:
-                                    other_cards.append((card_id, card_data))
-                        
-                        # Show high priority cards first, then fill with others
-                        cards_to_show = high_priority_cards + other_cards
-                        domain_limit = min(3, len(cards_to_show))  # Max 3 per domain
-                        
-                        for card_id, card_data in cards_to_show[:domain_limit]:
+                        # High priority cards first, then fill with others (max 3 per domain)
+                        for card in card_system.ranked_sections[domain_key][:3]:
                             if total_cards_shown >= 12:
                                 break
-                                
-                            card_name = card_data.get('name', card_id)
-                            star = card_data.get('associated_star', 'N/A')
-                            passive = card_data.get('passive_effect', 'TBD')
-                            active = card_data.get('active_effect', 'TBD')
-                            priority = card_data.get('implementation_priority', 'medium')
                             
                             # Clean up missing effects
+                            passive = card.passive_effect
+                            active = card.active_effect
                             if '[NEEDS IMPLEMENTATION]' in passive:
                                 passive = 'TBD'
                             if '[NEEDS IMPLEMENTATION]' in active:
                                 active = 'TBD'
                             
-                            output.append(f"- **{card_name}** ({star}) - Priority: {priority.title()}")
+                            output.append(f"- **{card.name}** ({card.associated_star}) - Priority: {card.priority.title()}")
                             output.append(f"  - Passive: {passive}")
                             output.append(f"  - Active: {active}")
                             
                             total_cards_shown += 1
                 
-                # Implementation status
-                impl_status = system_data.get('implementation_status', {})
-                if impl_status:
-                    complete_cards = impl_status.get('complete_cards', 0)
-                    
-                    # Handle cases where missing effects might be integers, lists, or strings (due to malformed YAML)
-                    missing_passive_raw = impl_status.get('missing_passive_effects', [])
-                    missing_active_raw = impl_status.get('missing_active_effects', [])
-                    
-                    def extract_count(value):
-                        if isinstance(value, int):
-                            return value
-                        elif isinstance(value, list):
-                            return len(value)
-                        elif isinstance(value, str):
-                            # If it's a string, try to extract the number from the beginning
-                            match = re.match(r'^(\d+)', value.strip())
-                            return int(match.group(1)) if match else 0
-                        else:
-                            return 0
-                    
-                    missing_passive = extract_count(missing_passive_raw)
-                    missing_active = extract_count(missing_active_raw)
-                    
-                    output.append(f"\n**Implementation Status**: {complete_cards} complete cards, {missing_passive + missing_active} need completion")
+                # Implementation status (counts normalized by CardSystem)
+                if card_system.has_implementation_status:
+                    missing_total = card_system.missing_passive + card_system.missing_active
+                    output.append(f"\n**Implementation Status**: {card_system.complete_cards} complete cards, {missing_total} need completion")
                 
                 output.append(f"\n**See**: `{system_info.get('content_reference', 'N/A')}` for complete visual designs and implementation details\n")
         
@@ -1658,87 +4206,98 @@ class DocumentationExporter:
         output.append("*YAML files contain authoritative mechanical data, Markdown files contain narrative context.*")
         
         export_file = self.export_path / "claude-context.md"
-        with open(export_file, 'w') as f:
-            f.write('\n'.join(output))
+        self._write_output(export_file, '\n'.join(output))
         
         print(f"Exported comprehensive Claude context to {export_file}")
         return export_file
     
+    def _read_referenced_file(self, path):
+        self._track_input(path)
+        try:
+            with open(path, 'r') as f:
+                return self.content_store.intern(f.read())
+        except Exception as e:
+            print(f"Warning: Could not read {path}: {e}")
+            return None
+    
     def load_referenced_content(self, content_path):
-        """Load and return the actual content of a referenced file"""
-        # Try different possible locations for the file
-        possible_paths = [
-            self.base_path / content_path,
-            self.base_path / "content" / content_path.replace("content/", ""),
-            self.base_path / content_path.replace("data/", "data/"),
-        ]
-        
-        for path in possible_paths:
-            if path.exists():
-                try:
-                    with open(path, 'r') as f:
-                        return f.read()
-                except Exception as e:
-                    print(f"Warning: Could not read {path}: {e}")
-        
-        # If not found, return a helpful message
-        return f"[CONTENT NOT FOUND: {content_path}]"
+        """Load the content of a referenced file, or None (recorded as unresolved) if it doesn't exist"""
+        path = self.path_index.resolve(content_path)
+        content = self._read_referenced_file(path) if path is not None else None
+        if content is None:
+            self.unresolved_references.setdefault(content_path, None)
+        return content
+    
+    def load_related_system(self, system_name):
+        """Return (file_path, content) for a related system; content is None if unresolved"""
+        file_path, path = self.path_index.resolve_system(system_name)
+        content = self._read_referenced_file(path) if path is not None else None
+        if content is None:
+            self.unresolved_references.setdefault(system_name, None)
+        return file_path, content
+    
+    def unresolved_summary(self):
+        """One bulk report of every reference that could not be resolved this run"""
+        if not self.unresolved_references:
+            return None
+        refs = ', '.join(self.unresolved_references)
+        return f"⚠️ {len(self.unresolved_references)} unresolved references (not embedded/exported): {refs}"
 
     def create_self_contained_context(self, system_data, include_archives=False):
-        """Create a self-contained context that embeds all referenced content"""
-        context = dict(system_data)
+        """Create a self-contained context that embeds all referenced content
+        
+        The embedded files, archives and repository info are computed only if a
+        rendered template reads them (see LazyTemplateContext).
+        """
+        context = LazyTemplateContext(system_data)
+        cross_references = system_data.get('cross_references', {})
         
         # Embed referenced content files
-        if 'cross_references' in system_data and 'content_files' in system_data['cross_references']:
+        def embedded_content_files():
             embedded_content = {}
-            for content_file in system_data['cross_references']['content_files']:
+            for content_file in cross_references['content_files']:
                 content = self.load_referenced_content(content_file)
-                embedded_content[content_file] = content
-            context['embedded_content_files'] = embedded_content
+                if content is not None:
+                    embedded_content[content_file] = content
+            return embedded_content
+        
+        if 'content_files' in cross_references:
+            context.defer('embedded_content_files', embedded_content_files)
         
         # Embed related system data
-        if 'cross_references' in system_data and 'related_systems' in system_data['cross_references']:
+        def embedded_related_systems():
             embedded_systems = {}
-            for system_name in system_data['cross_references']['related_systems']:
-                # Try to load the related system data
-                system_file = f"data/{system_name}.yaml"
-                system_content = self.load_referenced_content(system_file)
-                
-                # Also try other locations
-                if "[CONTENT NOT FOUND:" in system_content:
-                    # Try as an interface
-                    system_file = f"data/interfaces/{system_name}.yaml"
-                    system_content = self.load_referenced_content(system_file)
-                
-                if "[CONTENT NOT FOUND:" in system_content:
-                    # Try in content directory as markdown
-                    system_file = f"content/{system_name}.md"
-                    system_content = self.load_referenced_content(system_file)
+            for system_name in cross_references['related_systems']:
+                # data/, then data/interfaces/, then content/*.md
+                system_file, system_content = self.load_related_system(system_name)
+                if system_content is None:
+                    continue
                 
                 embedded_systems[system_name] = {
                     'file_path': system_file,
                     'content': system_content
                 }
-            context['embedded_related_systems'] = embedded_systems
+            return embedded_systems
+        
+        if 'related_systems' in cross_references:
+            context.defer('embedded_related_systems', embedded_related_systems)
         
         # Add comprehensive archives if requested
         if include_archives:
-            context.update({
-                'archived_content': self.load_markdown_content(),
-                'mentors_data': self.load_all_mentors(),
-                'constants_data': self.load_all_constants(),
-                'cards_data': self.load_all_cards(),
-                'bosses_data': self.load_all_bosses(),
-                'include_archives': True
-            })
+            context.defer('archived_content', lambda: self.corpus.content)
+            context.defer('mentors_data', lambda: self.corpus.mentors)
+            context.defer('constants_data', lambda: self.corpus.constants)
+            context.defer('cards_data', lambda: self.corpus.cards)
+            context.defer('bosses_data', lambda: self.corpus.bosses)
+            context['include_archives'] = True
         
         # Add repository context
-        context['repository_info'] = {
+        context.defer('repository_info', lambda: {
             'source_repository': 'rogue-resident-docs',
-            'base_path': str(self.base_path.absolute()),
+            'base_path': ARTIFACT_BASE_PATH_MARKER,
             'generated_at': self._get_timestamp(),
             'self_contained': True
-        }
+        })
         
         return context
 
@@ -1754,10 +4313,11 @@ class DocumentationExporter:
         else:
             print("🎭 Generating Three-Audience Workflow Documentation... ✨")
         
-        # Load all interface data
-        interfaces_data = self.load_all_interfaces()
+        interfaces_data = self.corpus.interfaces
         
-        if not interfaces_data:
+        # A requested system that exists never needs the full listing (which would
+        # make adding any other interface rebuild this one)
+        if (system_name is None or system_name not in interfaces_data) and not interfaces_data:
             print("❌ No interface data found! Please create interface YAML files in data/interfaces/")
             return
         
@@ -1788,49 +4348,16 @@ class DocumentationExporter:
             else:
                 print("✅ Basic self-contained context created with embedded references")
         
-        # Generate Audience 1: Conversational Context (Luke + Zach)
-        generated_files = []
-        
-        print("🗣️ Generating Audience 1: Conversational Context...")
-        try:
-            template = self.jinja_env.get_template('conversational-context.md.jinja')
-            output = template.render(**template_context)
-            
-            output_file = self.export_path / f"{system_name}-conversational.md"
-            with open(output_file, 'w') as f:
-                f.write(output)
-            generated_files.append(output_file)
-            print(f"✅ Conversational context: {output_file}")
-        except Exception as e:
-            print(f"❌ Error generating conversational context: {e}")
-        
-        # Generate Audience 2: Development Planning (Luke)
-        print("📋 Generating Audience 2: Development Planning...")
-        try:
-            template = self.jinja_env.get_template('development-planning.md.jinja')
-            output = template.render(**template_context)
-            
-            output_file = self.export_path / f"{system_name}-development-plan.md"
-            with open(output_file, 'w') as f:
-                f.write(output)
-            generated_files.append(output_file)
-            print(f"✅ Development plan: {output_file}")
-        except Exception as e:
-            print(f"❌ Error generating development plan: {e}")
-        
-        # Generate Audience 3: LLM Implementation Context (Claude)
-        print("🤖 Generating Audience 3: LLM Implementation Context...")
-        try:
-            template = self.jinja_env.get_template('llm-implementation-context.md.jinja')
-            output = template.render(**template_context)
-            
-            output_file = self.export_path / f"{system_name}-implementation-context.md"
-            with open(output_file, 'w') as f:
-                f.write(output)
-            generated_files.append(output_file)
-            print(f"✅ Implementation context: {output_file}")
-        except Exception as e:
-            print(f"❌ Error generating implementation context: {e}")
+        # Audience 1: Conversational Context (Luke + Zach), 2: Development Planning (Luke),
+        # 3: LLM Implementation Context (Claude)
+        generated_files = self._render_audience_documents([
+            ("🗣️ Generating Audience 1: Conversational Context...", 'conversational-context.md.jinja',
+             self.export_path / f"{system_name}-conversational.md", "Conversational context"),
+            ("📋 Generating Audience 2: Development Planning...", 'development-planning.md.jinja',
+             self.export_path / f"{system_name}-development-plan.md", "Development plan"),
+            ("🤖 Generating Audience 3: LLM Implementation Context...", 'llm-implementation-context.md.jinja',
+             self.export_path / f"{system_name}-implementation-context.md", "Implementation context")
+        ], template_context)
         
         # Copy files to specified directory if requested
         if copy_to and generated_files:
@@ -1847,27 +4374,27 @@ class DocumentationExporter:
     
     def _copy_files_to_destination(self, generated_files, copy_to, system_name):
         """Copy generated files to the specified destination directory"""
-        import shutil
-        
         try:
             destination_path = Path(copy_to)
             destination_path.mkdir(parents=True, exist_ok=True)
             
             print(f"\n📂 Copying files to {destination_path}...")
             
+            # Queued writes for this target have to land before they can be copied
+            self.writer.flush(self._build)
             for file_path in generated_files:
                 if file_path.exists():
                     dest_file = destination_path / file_path.name
-                    shutil.copy2(file_path, dest_file)
+                    self.writer.copy_file(file_path, dest_file)
+                    self._track_output(dest_file)
                     print(f"✅ Copied {file_path.name} → {dest_file}")
             
             # Copy references directory if it exists
             references_dir = self.export_path / "references"
             if references_dir.exists():
                 dest_references = destination_path / "references"
-                if dest_references.exists():
-                    shutil.rmtree(dest_references)
-                shutil.copytree(references_dir, dest_references)
+                self.writer.mirror_tree(references_dir, dest_references)
+                self._track_copied_tree(references_dir, dest_references)
                 print(f"✅ Copied references/ directory → {dest_references}")
             
             # Create a simple README in the destination
@@ -1903,8 +4430,7 @@ Source: Rogue Resident documentation system
 """
             
             readme_file = destination_path / "README.md"
-            with open(readme_file, 'w') as f:
-                f.write(readme_content)
+            self._write_output(readme_file, readme_content)
             print(f"✅ Created README.md → {readme_file}")
             
             print(f"🎉 Successfully copied all files to {destination_path}")
@@ -1922,52 +4448,41 @@ Source: Rogue Resident documentation system
         # Export related system files
         if 'cross_references' in system_data and 'related_systems' in system_data['cross_references']:
             for system_name in system_data['cross_references']['related_systems']:
-                # Try to find and export the system file
-                possible_paths = [
-                    f"data/{system_name}.yaml",
-                    f"data/interfaces/{system_name}.yaml",
-                    f"content/{system_name}.md"
-                ]
-                
-                for file_path in possible_paths:
-                    content = self.load_referenced_content(file_path)
-                    if "[CONTENT NOT FOUND:" not in content:
-                        # Export to references directory
-                        ref_file = references_dir / f"{system_name}.md"
-                        with open(ref_file, 'w') as f:
-                            f.write(f"# {system_name.replace('-', ' ').title()}\n\n")
-                            f.write(f"**Source**: `{file_path}`\n\n")
-                            f.write(content)
-                        exported_files.append(f"references/{system_name}.md")
-                        break
+                file_path, content = self.load_related_system(system_name)
+                if content is not None:
+                    # Export to references directory
+                    ref_file = references_dir / f"{system_name}.md"
+                    self._write_output(ref_file, f"# {system_name.replace('-', ' ').title()}\n\n"
+                                                 f"**Source**: `{file_path}`\n\n"
+                                                 f"{content}")
+                    exported_files.append(f"references/{system_name}.md")
         
         # Export content files
         if 'cross_references' in system_data and 'content_files' in system_data['cross_references']:
             for content_file in system_data['cross_references']['content_files']:
                 content = self.load_referenced_content(content_file)
-                if "[CONTENT NOT FOUND:" not in content:
+                if content is not None:
                     # Create subdirectories as needed
                     ref_file_path = references_dir / content_file.replace('content/', '')
                     ref_file_path.parent.mkdir(parents=True, exist_ok=True)
                     
-                    with open(ref_file_path, 'w') as f:
-                        f.write(content)
+                    self._write_output(ref_file_path, content)
                     exported_files.append(f"references/{content_file.replace('content/', '')}")
         
         return exported_files
 
     def create_file_reference_context(self, system_data, exported_files=None):
         """Create context that references local files instead of embedding content"""
-        context = dict(system_data)
+        context = LazyTemplateContext(system_data)
         
         # Add repository context
-        context['repository_info'] = {
+        context.defer('repository_info', lambda: {
             'source_repository': 'rogue-resident-docs',
-            'base_path': str(self.base_path.absolute()),
+            'base_path': ARTIFACT_BASE_PATH_MARKER,
             'generated_at': self._get_timestamp(),
             'self_contained': True,
             'references_exported': bool(exported_files)
-        }
+        })
         
         # Add list of exported reference files
         if exported_files:
@@ -1975,67 +4490,144 @@ Source: Rogue Resident documentation system
         
         # CRITICAL FIX: Populate embedded_related_systems with rich data for template access
         if 'embedded_related_systems' not in context:
-            context['embedded_related_systems'] = {}
-            
-            # Get all the data we need for rich template access
-            all_constants = system_data.get('constants_data', {})
-            all_content = system_data.get('content_data', {})
-            all_cards = system_data.get('cards_data', {})
-            
-            # Add key narrative systems with their rich data (same logic as self-contained context)
-            narrative_systems = [
-                'constellation-phenomenon', 'journal-system', 'visual-design', 
-                'activity-framework', 'amara-narrative', 'pico-character',
-                'etching-system', 'journal-integration', 'visual-time-system',
-                'complete-card-system', 'educational-framework', 'game-constants'
-            ]
-            
-            # Include constants data (YAML files with rich system specifications)
-            for system_name, system_data_item in all_constants.items():
-                if any(narrative_sys in system_name for narrative_sys in narrative_systems):
-                    if isinstance(system_data_item, dict):
-                        import yaml
-                        yaml_content = yaml.dump(system_data_item, default_flow_style=False, sort_keys=False)
-                        context['embedded_related_systems'][system_name] = {
-                            'file_path': f'data/constants/{system_name}.yaml',
-                            'content': yaml_content,
-                            'system_info': system_data_item.get('system_info', {}),
-                            'rich_data': system_data_item  # Keep structured data for template logic
-                        }
-            
-            # Include content data (markdown files with rich narrative content)
-            for content_file, content in all_content.items():
-                content_name = content_file.replace('content/', '').replace('.md', '').replace('/', '-')
-                if any(narrative_sys in content_name for narrative_sys in narrative_systems):
-                    context['embedded_related_systems'][content_name] = {
-                        'file_path': content_file,
-                        'content': content,
-                        'type': 'content'
-                    }
-            
-            # Include cards data from cards directory
-            for system_name, system_data_item in all_cards.items():
-                if any(narrative_sys in system_name for narrative_sys in narrative_systems):
-                    if isinstance(system_data_item, dict):
-                        import yaml
-                        yaml_content = yaml.dump(system_data_item, default_flow_style=False, sort_keys=False)
-                        context['embedded_related_systems'][system_name] = {
-                            'file_path': f'data/cards/{system_name}.yaml',
-                            'content': yaml_content,
-                            'system_info': system_data_item.get('system_info', {}),
-                            'rich_data': system_data_item  # Keep structured data for template logic
-                        }
+            # Same embedded systems as the self-contained narrative context
+            context.defer('embedded_related_systems', lambda: self._narrative_embedded_systems(
+                system_data.get('constants_data', {}), system_data.get('content_data', {}),
+                system_data.get('cards_data', {})))
         
         return context
 
-    def export_narrative_workflow(self, focus_area=None, include_archives=False, copy_to=None, export_references=False):
-        """🎭 Export documentation for the narrative/lore/storybuilding workflow! 🎭"""
+    def _narrative_memo(self, key, build):
+        """Memo of narrative context pieces, valid for the current corpus snapshot
+        
+        Each entry keeps the inputs and listings its build read, and a hit adds
+        them to the running target, so every focus area depends on them.
+        """
+        corpus = self.corpus
+        if isinstance(corpus, TrackedCorpus):
+            corpus = corpus.corpus
+        if self._narrative_memo_corpus is not corpus:
+            self._narrative_memo_values = {}
+            self._narrative_memo_corpus = corpus
+        entry = self._narrative_memo_values.get(key)
+        if entry is None:
+            target_build = self._build
+            self._build = TargetBuild()
+            try:
+                value = build()
+                reads = self._build
+            finally:
+                self._build = target_build
+            entry = self._narrative_memo_values[key] = (value, reads.inputs, reads.listings)
+        value, inputs, listings = entry
+        if self._build is not None:
+            self._build.inputs.update(inputs)
+            self._build.listings.update(listings)
+        return value
+    
+    def _structure_mentors(self, mentor_file):
+        """[(mentor_id, structured mentor)] for one mentors file"""
+        mentor_data = self.corpus.mentors[mentor_file]
+        if 'mentors' not in mentor_data:
+            return []
+        structured = []
+        # Extract individual mentors from the structured data
+        for mentor_id, mentor_info in mentor_data['mentors'].items():
+            structured.append((mentor_id, {
+                'name': mentor_info.get('full_name', mentor_info.get('title', mentor_id)),
+                'title': mentor_info.get('title', mentor_id),
+                'role': mentor_info.get('role', 'Medical Physics Mentor'),
+                'teaching_style': mentor_info.get('character_traits', {}).get('teaching_style', 'supportive_guidance'),
+                'personality': {
+                    'primary': mentor_info.get('character_traits', {}).get('primary', 'professional'),
+                    'dialogue_style': mentor_info.get('character_traits', {}).get('communication_style', 'supportive'),
+                    'domain_expertise': mentor_info.get('domain_expertise', 'medical_physics')
+                },
+                'narrative_role': mentor_info.get('narrative_role', {}),
+                'dialogue_themes': mentor_info.get('dialogue_themes', [])
+            }))
+        return structured
+    
+    def _structure_boss(self, boss_name):
+        """Boss character entry for the narrative templates, or None without a boss_encounter"""
+        boss_data = self.corpus.bosses[boss_name]
+        if 'boss_encounter' not in boss_data:
+            return None
+        encounter = boss_data['boss_encounter']
+        return {
+            'name': encounter.get('character_name', boss_name.replace('-', ' ').title()),
+            'type': encounter.get('encounter_type', 'character_conflict'),
+            'description': encounter.get('description', 'Character encounter'),
+            'character_arc': encounter.get('character_development', {}),
+            'phases': encounter.get('phases', {}),
+            'difficulty': encounter.get('difficulty', 'intermediate'),
+            'season': encounter.get('season', 'varies'),
+            'duration': encounter.get('duration', '20-30 minutes'),
+            'mastery_required': encounter.get('mastery_required', '40%'),
+            'special_mechanic': encounter.get('special_mechanic', 'standard'),
+            'preparation_activities': encounter.get('preparation_activities', []),
+            'sp_reward': encounter.get('rewards', {}).get('sp_reward', 20),
+            'special_traits': encounter.get('special_traits', []),
+            'rich_encounter_data': encounter  # Keep full data for templates
+        }
+    
+    def _structure_character_arcs(self):
+        """Character arc entries from content/character-arcs/"""
+        character_arcs = {}
+        all_content = self.corpus.content
+        # Keys first, so only the arc files are read (and become inputs)
+        for content_file in [name for name in all_content if 'character-arcs/' in name]:
+            content = all_content[content_file]
+            char_name = content_file.replace('character-arcs/', '').replace('.md', '')
+            # Extract key info from markdown content
+            character_arcs[char_name] = {
+                'file': content_file,
+                'content_preview': content[:500] + '...' if len(content) > 500 else content,
+                'full_content': content
+            }
+        return character_arcs
+    
+    def _narrative_embedded_systems(self, all_constants, all_content, all_cards):
+        """embedded_related_systems for a narrative context; entries are built once per corpus"""
+        embedded_related_systems = {}
         
-        if include_archives:
-            print("📚 Generating Enhanced Narrative Workflow Documentation (with archives)... ✨")
-        else:
-            print("📚 Generating Narrative Workflow Documentation... ✨")
+        # Include constants data (YAML files with rich system specifications)
+        for system_name, system_data in all_constants.items():
+            if any(narrative_sys in system_name for narrative_sys in NARRATIVE_EMBED_SYSTEMS):
+                if isinstance(system_data, dict):
+                    embedded_related_systems[system_name] = self._narrative_memo(
+                        ('embed', 'constants', system_name),
+                        lambda: self._embedded_yaml_entry('constants', system_name, system_data))
+        
+        # Include content data (markdown files with rich narrative content)
+        for content_file, content in all_content.items():
+            content_name = content_file.replace('content/', '').replace('.md', '').replace('/', '-')
+            if any(narrative_sys in content_name for narrative_sys in NARRATIVE_EMBED_SYSTEMS):
+                embedded_related_systems[content_name] = self._narrative_memo(
+                    ('embed', 'content', content_file),
+                    lambda: {'file_path': content_file, 'content': content, 'type': 'content'})
+        
+        # Include cards data from cards directory
+        for system_name, system_data in all_cards.items():
+            if any(narrative_sys in system_name for narrative_sys in NARRATIVE_EMBED_SYSTEMS):
+                if isinstance(system_data, dict):
+                    embedded_related_systems[system_name] = self._narrative_memo(
+                        ('embed', 'cards', system_name),
+                        lambda: self._embedded_yaml_entry('cards', system_name, system_data))
         
+        return embedded_related_systems
+    
+    def _embedded_yaml_entry(self, category, system_name, system_data):
+        return {
+            'file_path': f'data/{category}/{system_name}.yaml',
+            # The file's own text, comments and all, for templates
+            'content': self._embeddable_yaml(category, system_name, system_data),
+            'system_info': system_data.get('system_info', {}),
+            'rich_data': system_data  # Keep structured data for template logic
+        }
+    
+    def build_narrative_context(self, focus_area=None):
+        """Narrative template context for one focus area (character, world, plot, all or a system name)"""
         # Determine focus area - can be character, world, plot, or a specific system
         focus_areas = {
             'character': ['pico-character', 'amara-narrative', 'mentors'],
@@ -2056,13 +4648,14 @@ Source: Rogue Resident documentation system
                 print("🎯 Creating comprehensive narrative documentation...")
         
         # Load all available data for narrative context
+        corpus = self.corpus
         all_data = {
-            'constants': self.load_all_constants(),
-            'mentors': self.load_all_mentors(),
-            'cards': self.load_all_cards(),
-            'bosses': self.load_all_bosses(),
-            'interfaces': self.load_all_interfaces(),
-            'content': self.load_markdown_content()
+            'constants': corpus.constants,
+            'mentors': corpus.mentors,
+            'cards': corpus.cards,
+            'bosses': corpus.bosses,
+            'interfaces': corpus.interfaces,
+            'content': corpus.content
         }
         
         # Don't filter data too aggressively - always include core narrative elements
@@ -2078,9 +4671,10 @@ Source: Rogue Resident documentation system
                     filtered_data[category] = data
                 else:
                     filtered_data[category] = {}
-                    for system_name, system_data in data.items():
+                    # Match on names first so lazy corpora only load what is kept
+                    for system_name in data:
                         if any(target in system_name for target in expanded_targets) or system_name in core_narrative_systems:
-                            filtered_data[category][system_name] = system_data
+                            filtered_data[category][system_name] = data[system_name]
             narrative_data = filtered_data
         else:
             narrative_data = all_data
@@ -2101,62 +4695,22 @@ Source: Rogue Resident documentation system
             'constraints': 'Must maintain medical physics accuracy while creating emotionally engaging narrative'
         }
         
-        # Extract and structure mentor data properly
+        # Structured mentors, boss characters and character arcs are derived
+        # once per corpus and shared by every focus area (see _narrative_memo)
         mentors_structured = {}
-        if 'mentors' in narrative_data and narrative_data['mentors']:
-            for mentor_file, mentor_data in narrative_data['mentors'].items():
-                if 'mentors' in mentor_data:
-                    # Extract individual mentors from the structured data
-                    for mentor_id, mentor_info in mentor_data['mentors'].items():
-                        mentors_structured[mentor_id] = {
-                            'name': mentor_info.get('full_name', mentor_info.get('title', mentor_id)),
-                            'title': mentor_info.get('title', mentor_id),
-                            'role': mentor_info.get('role', 'Medical Physics Mentor'),
-                            'teaching_style': mentor_info.get('character_traits', {}).get('teaching_style', 'supportive_guidance'),
-                            'personality': {
-                                'primary': mentor_info.get('character_traits', {}).get('primary', 'professional'),
-                                'dialogue_style': mentor_info.get('character_traits', {}).get('communication_style', 'supportive'),
-                                'domain_expertise': mentor_info.get('domain_expertise', 'medical_physics')
-                            },
-                            'narrative_role': mentor_info.get('narrative_role', {}),
-                            'dialogue_themes': mentor_info.get('dialogue_themes', [])
-                        }
-        
-        # Extract boss character data
+        for mentor_file in narrative_data.get('mentors', {}):
+            for mentor_id, mentor in self._narrative_memo(('mentors', mentor_file),
+                                                          lambda: self._structure_mentors(mentor_file)):
+                mentors_structured[mentor_id] = mentor
+        
         boss_characters = {}
-        if 'bosses' in narrative_data:
-            for boss_name, boss_data in narrative_data['bosses'].items():
-                if 'boss_encounter' in boss_data:
-                    encounter = boss_data['boss_encounter']
-                    boss_characters[boss_name] = {
-                        'name': encounter.get('character_name', boss_name.replace('-', ' ').title()),
-                        'type': encounter.get('encounter_type', 'character_conflict'),
-                        'description': encounter.get('description', 'Character encounter'),
-                        'character_arc': encounter.get('character_development', {}),
-                        'phases': encounter.get('phases', {}),
-                        'difficulty': encounter.get('difficulty', 'intermediate'),
-                        'season': encounter.get('season', 'varies'),
-                        'duration': encounter.get('duration', '20-30 minutes'),
-                        'mastery_required': encounter.get('mastery_required', '40%'),
-                        'special_mechanic': encounter.get('special_mechanic', 'standard'),
-                        'preparation_activities': encounter.get('preparation_activities', []),
-                        'sp_reward': encounter.get('rewards', {}).get('sp_reward', 20),
-                        'special_traits': encounter.get('special_traits', []),
-                        'rich_encounter_data': encounter  # Keep full data for templates
-                    }
+        for boss_name in narrative_data.get('bosses', {}):
+            boss = self._narrative_memo(('boss', boss_name), lambda: self._structure_boss(boss_name))
+            if boss is not None:
+                boss_characters[boss_name] = boss
         
-        # Extract character arc data from content files
-        character_arcs = {}
-        if 'content' in narrative_data:
-            for content_file, content in narrative_data['content'].items():
-                if 'character-arcs/' in content_file:
-                    char_name = content_file.replace('character-arcs/', '').replace('.md', '')
-                    # Extract key info from markdown content
-                    character_arcs[char_name] = {
-                        'file': content_file,
-                        'content_preview': content[:500] + '...' if len(content) > 500 else content,
-                        'full_content': content
-                    }
+        # Content is never filtered, so every focus area shares one arcs mapping
+        character_arcs = self._narrative_memo(('character_arcs',), self._structure_character_arcs)
         
         # Create enhanced narrative context with properly structured data
         narrative_context = {
@@ -2259,6 +4813,18 @@ Source: Rogue Resident documentation system
             }
         }
         
+        return narrative_context
+    
+    def export_narrative_workflow(self, focus_area=None, include_archives=False, copy_to=None, export_references=False):
+        """🎭 Export documentation for the narrative/lore/storybuilding workflow! 🎭"""
+        
+        if include_archives:
+            print("📚 Generating Enhanced Narrative Workflow Documentation (with archives)... ✨")
+        else:
+            print("📚 Generating Narrative Workflow Documentation... ✨")
+        
+        narrative_context = self.build_narrative_context(focus_area)
+        
         # Choose context creation approach
         if export_references:
             print("📚 Creating context with local file references...")
@@ -2275,53 +4841,17 @@ Source: Rogue Resident documentation system
             else:
                 print("✅ Basic self-contained narrative context created")
         
-        # Generate the three narrative-focused documents
-        generated_files = []
-        
-        # Generate Narrative Context (for writers/narrative designers)
-        print("🎭 Generating Narrative Context (Writers & Narrative Designers)...")
-        try:
-            template = self.jinja_env.get_template('narrative-context.md.jinja')
-            output = template.render(**template_context)
-            
-            focus_suffix = f"-{focus_area}" if focus_area and focus_area != 'all' else ""
-            output_file = self.export_path / f"narrative{focus_suffix}-context.md"
-            with open(output_file, 'w') as f:
-                f.write(output)
-            generated_files.append(output_file)
-            print(f"✅ Narrative context: {output_file}")
-        except Exception as e:
-            print(f"❌ Error generating narrative context: {e}")
-        
-        # Generate Lore Implementation Guide (for developers)
-        print("🛠️ Generating Lore Implementation Guide (Developers)...")
-        try:
-            template = self.jinja_env.get_template('lore-implementation.md.jinja')
-            output = template.render(**template_context)
-            
-            focus_suffix = f"-{focus_area}" if focus_area and focus_area != 'all' else ""
-            output_file = self.export_path / f"lore{focus_suffix}-implementation.md"
-            with open(output_file, 'w') as f:
-                f.write(output)
-            generated_files.append(output_file)
-            print(f"✅ Lore implementation: {output_file}")
-        except Exception as e:
-            print(f"❌ Error generating lore implementation: {e}")
-        
-        # Generate Story Continuity Reference (for AI assistants)
-        print("🧠 Generating Story Continuity Reference (AI Assistants)...")
-        try:
-            template = self.jinja_env.get_template('story-continuity.md.jinja')
-            output = template.render(**template_context)
-            
-            focus_suffix = f"-{focus_area}" if focus_area and focus_area != 'all' else ""
-            output_file = self.export_path / f"story{focus_suffix}-continuity.md"
-            with open(output_file, 'w') as f:
-                f.write(output)
-            generated_files.append(output_file)
-            print(f"✅ Story continuity: {output_file}")
-        except Exception as e:
-            print(f"❌ Error generating story continuity: {e}")
+        # Generate the three narrative-focused documents: writers & narrative designers,
+        # developers, and AI assistants
+        focus_suffix = f"-{focus_area}" if focus_area and focus_area != 'all' else ""
+        generated_files = self._render_audience_documents([
+            ("🎭 Generating Narrative Context (Writers & Narrative Designers)...", 'narrative-context.md.jinja',
+             self.export_path / f"narrative{focus_suffix}-context.md", "Narrative context"),
+            ("🛠️ Generating Lore Implementation Guide (Developers)...", 'lore-implementation.md.jinja',
+             self.export_path / f"lore{focus_suffix}-implementation.md", "Lore implementation"),
+            ("🧠 Generating Story Continuity Reference (AI Assistants)...", 'story-continuity.md.jinja',
+             self.export_path / f"story{focus_suffix}-continuity.md", "Story continuity")
+        ], template_context)
         
         # Copy files to specified directory if requested
         if copy_to and generated_files:
@@ -2347,44 +4877,38 @@ Source: Rogue Resident documentation system
         character_arcs = ['character-arcs/amara-sato.md', 'character-arcs/pico.md', 'character-arcs/marcus-chen.md']
         for arc_file in character_arcs:
             content = self.load_referenced_content(f"content/{arc_file}")
-            if "[CONTENT NOT FOUND:" not in content:
+            if content is not None:
                 ref_file_path = references_dir / arc_file
                 ref_file_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(ref_file_path, 'w') as f:
-                    f.write(content)
+                self._write_output(ref_file_path, content)
                 exported_files.append(f"references/{arc_file}")
         
         # Export mentor philosophy file
         mentor_philosophy = 'mentors/mentor-philosophies.md'
         content = self.load_referenced_content(f"content/{mentor_philosophy}")
-        if "[CONTENT NOT FOUND:" not in content:
+        if content is not None:
             ref_file_path = references_dir / mentor_philosophy
             ref_file_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(ref_file_path, 'w') as f:
-                f.write(content)
+            self._write_output(ref_file_path, content)
             exported_files.append(f"references/{mentor_philosophy}")
         
         # Export visual design philosophy
         visual_design = 'visual-design-philosophy.md'
         content = self.load_referenced_content(f"content/{visual_design}")
-        if "[CONTENT NOT FOUND:" not in content:
+        if content is not None:
             ref_file_path = references_dir / visual_design
-            with open(ref_file_path, 'w') as f:
-                f.write(content)
+            self._write_output(ref_file_path, content)
             exported_files.append(f"references/{visual_design}")
         
         # Export key narrative YAML files as readable references
         narrative_systems = ['pico-character', 'amara-narrative', 'constellation-phenomenon', 'journal-system']
         for system_name in narrative_systems:
             content = self.load_referenced_content(f"data/constants/{system_name}.yaml")
-            if "[CONTENT NOT FOUND:" not in content:
+            if content is not None:
                 ref_file = references_dir / f"{system_name}.md"
-                with open(ref_file, 'w') as f:
-                    f.write(f"# {system_name.replace('-', ' ').title()}\n\n")
-                    f.write(f"**Source**: `data/constants/{system_name}.yaml`\n\n")
-                    f.write("```yaml\n")
-                    f.write(content)
-                    f.write("\n```\n")
+                self._write_output(ref_file, f"# {system_name.replace('-', ' ').title()}\n\n"
+                                             f"**Source**: `data/constants/{system_name}.yaml`\n\n"
+                                             f"```yaml\n{content}\n```\n")
                 exported_files.append(f"references/{system_name}.md")
         
         return exported_files
@@ -2392,70 +4916,17 @@ Source: Rogue Resident documentation system
     def create_self_contained_narrative_context(self, narrative_context, include_archives):
         """Create narrative context with embedded content instead of file references"""
         
-        # Get all the data we need
-        all_constants = narrative_context.get('constants_data', {})
         all_content = narrative_context.get('content_data', {})
         
-        # Create embedded systems data with rich YAML content
-        embedded_related_systems = {}
-        
-        # Add key narrative systems with their rich data
-        narrative_systems = [
-            'constellation-phenomenon', 'journal-system', 'visual-design', 
-            'activity-framework', 'amara-narrative', 'pico-character',
-            'etching-system', 'journal-integration', 'visual-time-system',
-            'complete-card-system', 'educational-framework', 'game-constants'
-        ]
-        
-        # Include constants data (YAML files with rich system specifications)
-        for system_name, system_data in all_constants.items():
-            if any(narrative_sys in system_name for narrative_sys in narrative_systems):
-                # Extract the actual YAML content for template use
-                if isinstance(system_data, dict):
-                    # Convert YAML data to readable string format for templates
-                    import yaml
-                    yaml_content = yaml.dump(system_data, default_flow_style=False, sort_keys=False)
-                    embedded_related_systems[system_name] = {
-                        'file_path': f'data/constants/{system_name}.yaml',
-                        'content': yaml_content,
-                        'system_info': system_data.get('system_info', {}),
-                        'rich_data': system_data  # Keep structured data for template logic
-                    }
-        
-        # Include content data (markdown files with rich narrative content)
-        for content_file, content in all_content.items():
-            content_name = content_file.replace('content/', '').replace('.md', '').replace('/', '-')
-            if any(narrative_sys in content_name for narrative_sys in narrative_systems):
-                embedded_related_systems[content_name] = {
-                    'file_path': content_file,
-                    'content': content,
-                    'type': 'content'
-                }
-        
-        # Include cards data from cards directory
-        all_cards = narrative_context.get('cards_data', {})
-        for system_name, system_data in all_cards.items():
-            if any(narrative_sys in system_name for narrative_sys in narrative_systems):
-                if isinstance(system_data, dict):
-                    import yaml
-                    yaml_content = yaml.dump(system_data, default_flow_style=False, sort_keys=False)
-                    embedded_related_systems[system_name] = {
-                        'file_path': f'data/cards/{system_name}.yaml',
-                        'content': yaml_content,
-                        'system_info': system_data.get('system_info', {}),
-                        'rich_data': system_data  # Keep structured data for template logic
-                    }
-        
-        # Create enhanced context with rich embedded data
-        context = {
-            **narrative_context,
-            'embedded_related_systems': embedded_related_systems,
-            'repository_info': {
-                'source_repository': 'rogue-resident-docs',
-                'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'references_exported': False
-            }
-        }
+        # Create enhanced context with rich embedded data, computed on first use
+        context = LazyTemplateContext(narrative_context)
+        context.defer('embedded_related_systems', lambda: self._narrative_embedded_systems(
+            narrative_context.get('constants_data', {}), all_content, narrative_context.get('cards_data', {})))
+        context.defer('repository_info', lambda: {
+            'source_repository': 'rogue-resident-docs',
+            'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'references_exported': False
+        })
         
         if include_archives:
             # Add archive content if available
@@ -2465,8 +4936,6 @@ Source: Rogue Resident documentation system
 
     def _copy_narrative_files_to_destination(self, generated_files, copy_to, focus_area):
         """Copy narrative workflow files to the specified destination directory"""
-        import shutil
-        
         try:
             destination_path = Path(copy_to)
             destination_path.mkdir(parents=True, exist_ok=True)
@@ -2474,19 +4943,21 @@ Source: Rogue Resident documentation system
             focus_label = f" ({focus_area.title()})" if focus_area and focus_area != 'all' else ""
             print(f"\n📂 Copying narrative workflow files{focus_label} to {destination_path}...")
             
+            # Queued writes for this target have to land before they can be copied
+            self.writer.flush(self._build)
             for file_path in generated_files:
                 if file_path.exists():
                     dest_file = destination_path / file_path.name
-                    shutil.copy2(file_path, dest_file)
+                    self.writer.copy_file(file_path, dest_file)
+                    self._track_output(dest_file)
                     print(f"✅ Copied {file_path.name} → {dest_file}")
             
             # Copy references directory if it exists
             references_dir = self.export_path / "references"
             if references_dir.exists():
                 dest_references = destination_path / "references"
-                if dest_references.exists():
-                    shutil.rmtree(dest_references)
-                shutil.copytree(references_dir, dest_references)
+                self.writer.mirror_tree(references_dir, dest_references)
+                self._track_copied_tree(references_dir, dest_references)
                 print(f"✅ Copied references/ directory → {dest_references}")
             
             # Create narrative-specific README
@@ -2518,8 +4989,7 @@ Source: Rogue Resident documentation system
 """
             
             readme_file = destination_path / "README.md"
-            with open(readme_file, 'w') as f:
-                f.write(readme_content)
+            self._write_output(readme_file, readme_content)
             print(f"✅ Created README.md → {readme_file}")
             
             print(f"🎉 Successfully copied all narrative files to {destination_path}")
@@ -2527,14 +4997,28 @@ Source: Rogue Resident documentation system
         except Exception as e:
             print(f"❌ Error copying narrative files to {copy_to}: {e}")
 
-def main():
-    parser = argparse.ArgumentParser(description='Export Rogue Resident documentation')
-    parser.add_argument('--format', choices=['nextjs', 'claude', 'visual', 'workflow', 'narrative', 'all'], 
+MODULE_IMPORT_MS = (time.perf_counter() - _MODULE_IMPORT_START) * 1000
+
+
+def import_timing_report():
+    """Module import time against IMPORT_BUDGET_MS, plus each deferred import actually paid"""
+    status = "✅ within" if MODULE_IMPORT_MS <= IMPORT_BUDGET_MS else "⚠️ over"
+    lines = [f"⏱️ export.py import: {MODULE_IMPORT_MS:.1f} ms ({status} {IMPORT_BUDGET_MS} ms budget)"]
+    for module_name, seconds in HEAVY_IMPORT_TIMINGS.items():
+        lines.append(f"⏱️ deferred import {module_name}: {seconds * 1000:.1f} ms")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """CLI entry point; argv defaults to sys.argv[1:] (docs.py passes its own list)"""
+    parser = argparse.ArgumentParser(prog='export.py', description='Export Rogue Resident documentation')
+    parser.add_argument('--format', choices=['nextjs', 'claude', 'visual', 'workflow', 'narrative', 'matrix', 'all'], 
                        default='all', help='Export format')
     parser.add_argument('--system', 
-                       help='System name for workflow export (e.g., activity-interface)')
-    parser.add_argument('--focus-area', choices=['character', 'world', 'plot', 'all'],
-                       help='Focus area for narrative workflow (character, world, plot, or all)')
+                       help='System name for workflow export (e.g., activity-interface), a comma-separated list, or "all"')
+    parser.add_argument('--focus-area', choices=['character', 'world', 'plot', 'all', 'every'],
+                       help='Focus area for narrative workflow (character, world, plot, or all); '
+                            '"every" renders all four in one pass')
     parser.add_argument('--base-path', default='.', 
                        help='Base path for the project')
     parser.add_argument('--include-archives', action='store_true',
@@ -2543,25 +5027,152 @@ def main():
                        help='Export referenced files to references/ directory instead of embedding inline')
     parser.add_argument('--copy-to', 
                        help='Copy generated files to specified directory (e.g., ../rogue-resident/docs/)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Parse every YAML file and compile every template from scratch instead of using the on-disk caches')
+    parser.add_argument('--cache-dir',
+                       help='Directory for export caches (default: <base-path>/.export-cache)')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                       help='Parse YAML across N worker processes (0 = one per CPU core, default: 1)')
+    parser.add_argument('--workers', type=int, default=3, metavar='N',
+                       help='Run the formats of --format all on up to N threads (default: 3, 1 = one after another)')
+    parser.add_argument('--render-workers', type=int, default=1, metavar='N',
+                       help='Render the three audience documents of a workflow in up to N worker processes '
+                            '(default: 1 = in this process; ignored with --stream)')
+    parser.add_argument('--write-workers', type=int, default=0, metavar='N',
+                       help='Write output files on N background threads while rendering continues (default: 0)')
+    parser.add_argument('--write-queue', type=int, default=64, metavar='N',
+                       help='Most pending background writes per writer thread before rendering waits (default: 64)')
+    parser.add_argument('--stream', action='store_true',
+                       help='Write workflow and narrative documents to disk in chunks as they render')
+    parser.add_argument('--lazy', action='store_true',
+                       help='Load each data/content file only when an export first touches it')
+    parser.add_argument('--stats', action='store_true',
+                       help='Report cache, load, write and content store statistics at the end of the run')
+    parser.add_argument('--import-timings', action='store_true',
+                       help='Report module import time against the startup budget and each deferred import')
+    parser.add_argument('--yaml-backend', choices=YAML_BACKENDS, default='auto',
+                       help='YAML implementation: libyaml (c), pure Python, or auto-detect (default)')
+    parser.add_argument('--force', action='store_true',
+                       help='Rebuild every output even if the build manifest says it is up to date')
+    parser.add_argument('--artifact-cache', default=os.environ.get('ROGUE_DOCS_ARTIFACT_CACHE'), metavar='DIR',
+                       help='Reuse rendered outputs from this (optionally shared) directory when inputs match '
+                            '(default: $ROGUE_DOCS_ARTIFACT_CACHE, off if unset)')
+    parser.add_argument('--artifact-cache-size', type=int, default=ARTIFACT_CACHE_MAX_MB, metavar='MB',
+                       help=f'Evict least recently used artifacts beyond this size (default: {ARTIFACT_CACHE_MAX_MB})')
+    parser.add_argument('--shard', default='1/1', metavar='I/N',
+                       help='With --format matrix: render only shard I of N (balanced on previous run times)')
+    parser.add_argument('--list-jobs', action='store_true',
+                       help='With --format matrix: print the jobs of --shard and exit')
+    parser.add_argument('--merge-shards', nargs='+', metavar='DIR',
+                       help='Merge exports/matrix/ trees produced by shard runs into this exports/matrix/')
+    parser.add_argument('--matrix-timings', metavar='FILE',
+                       help='Job timings used to balance shards (default: <cache-dir>/matrix-timings.json); '
+                            'every node must use the same file')
+    parser.add_argument('--watch', action='store_true',
+                       help='Keep running and re-export whatever depends on each changed data/, content/ or templates/ file')
+    parser.add_argument('--watch-interval', type=float, default=0.5, metavar='SECONDS',
+                       help='Polling interval for --watch (default: 0.5)')
+    
+    args = parser.parse_args(argv)
+    if args.watch_interval <= 0:
+        parser.error("--watch-interval must be positive")
+    try:
+        shard = parse_shard(args.shard)
+    except ValueError as e:
+        parser.error(str(e))
+    
+    try:
+        exporter = DocumentationExporter(args.base_path, use_cache=not args.no_cache,
+                                         cache_dir=args.cache_dir, yaml_backend=args.yaml_backend,
+                                         jobs=args.jobs, lazy=args.lazy, force=args.force,
+                                         artifact_cache=args.artifact_cache,
+                                         artifact_cache_max_mb=args.artifact_cache_size,
+                                         render_workers=args.render_workers,
+                                         write_workers=args.write_workers, write_queue_size=args.write_queue,
+                                         stream_renders=args.stream)
+    except ValueError as e:
+        parser.error(str(e))
+    
+    if args.list_jobs:
+        print(exporter.list_matrix_jobs(shard, args.matrix_timings))
+        exporter.close()
+        return
+    
+    if args.merge_shards:
+        missing = exporter.merge_matrix_shards(args.merge_shards, args.matrix_timings)
+        write_errors = exporter.close()
+        if args.stats:
+            print(exporter.writer.summary())
+        if missing or write_errors:
+            sys.exit(1)
+        return
+    
+    failed_tasks = []
+    # Targets that reported failure instead of raising (batch members, matrix jobs)
+    failed_targets = []
+    
+    def run_targets():
+        failed_tasks.clear()
+        failed_targets.clear()
+        if args.format == 'all':
+            failed_tasks.extend(exporter.export_all(args.workers))
+            for task in failed_tasks:
+                print(f"❌ {task.name} failed:")
+                traceback.print_exception(type(task.error), task.error, task.error.__traceback__)
+    
+        if args.format == 'nextjs':
+            exporter.run_target('nextjs', {}, exporter.export_for_nextjs)
+    
+        if args.format == 'claude':
+            exporter.run_target('claude', {}, exporter.export_claude_context)
     
-    args = parser.parse_args()
+        if args.format == 'visual':
+            exporter.run_target('visual', {}, exporter.export_visual_relationship_maps)
     
-    exporter = DocumentationExporter(args.base_path)
+        if args.format == 'workflow':
+            results = exporter.export_workflow_batch(exporter.workflow_systems(args.system),
+                                                     args.include_archives, args.copy_to, args.export_references)
+            failed_targets.extend(name for name, status, _ in results if status == 'failed')
     
-    if args.format in ['nextjs', 'all']:
-        exporter.export_for_nextjs()
+        if args.format == 'narrative':
+            focus_areas = list(NARRATIVE_FOCUS_AREAS) if args.focus_area == 'every' else [args.focus_area]
+            results = exporter.export_narrative_batch(focus_areas, args.include_archives,
+                                                      args.copy_to, args.export_references)
+            failed_targets.extend(name for name, status, _ in results if status == 'failed')
     
-    if args.format in ['claude', 'all']:
-        exporter.export_claude_context()
+        if args.format == 'matrix':
+            failed_targets.extend(exporter.run_matrix(shard, args.matrix_timings))
     
-    if args.format in ['visual', 'all']:
-        exporter.export_visual_relationship_maps()
+    run_targets()
+    if args.watch:
+        # --force applies to the first pass only; after that the manifest decides
+        exporter.force = False
+        exporter.watch(run_targets, args.watch_interval)
     
-    if args.format == 'workflow':
-        exporter.export_three_audience_workflow(args.system, args.include_archives, args.copy_to, args.export_references)
+    write_errors = exporter.close()
+    unresolved = exporter.unresolved_summary()
+    if unresolved:
+        print(unresolved)
+    print(exporter.manifest.summary())
+    if exporter.artifacts is not None:
+        print(exporter.artifacts.summary())
+    if args.stats:
+        print(exporter.writer.summary())
+        print(exporter.load_summary())
+        print(exporter.content_store.summary())
+        if exporter.yaml_cache is not None:
+            print(exporter.yaml_cache.summary())
+        if exporter.template_cache is not None and exporter.template_cache.hits + exporter.template_cache.misses:
+            print(exporter.template_cache.summary())
+        if exporter.fragment_cache is not None and exporter.fragment_cache.hits + exporter.fragment_cache.misses:
+            print(exporter.fragment_cache.summary())
+        print(exporter.yaml_backend_summary())
+    if args.import_timings:
+        print(import_timing_report())
     
-    if args.format == 'narrative':
-        exporter.export_narrative_workflow(args.focus_area, args.include_archives, args.copy_to, args.export_references)
+    # Failed tasks reflect the last pass (the final one under --watch)
+    if failed_tasks or failed_targets or write_errors:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file